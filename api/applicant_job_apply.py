@@ -3,25 +3,47 @@ ApplicantJobApply module - CRUD operations for the applicant_job_apply table
 """
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from dataclasses import dataclass
+
+from .cache import cached_record, record_cache, shared_record
 from .database import (
     query_table,
+    get_record_by_id,
+    iter_table,
     insert_record,
     update_record,
     delete_record,
 )
+from .applicants import Applicant, TABLE_NAME as APPLICANTS_TABLE, COLUMNS as APPLICANT_COLUMNS
+from .job_descriptions import JobDescription, TABLE_NAME as JOB_DESCRIPTIONS_TABLE
+from .utils import fast_uuid, make_decoders, now_iso, parse_timestamp
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ApplicantJobApply:
     """ApplicantJobApply data model - represents a job application"""
     applicant_id: uuid.UUID
     job_description_id: uuid.UUID
     id: Optional[int] = None
-    created_at: Optional[datetime] = None
-    deactive_at: Optional[datetime] = None
+    # Raw timestamp strings; parsed only when created_at/deactive_at is accessed
+    created_at_iso: Optional[str] = None
+    deactive_at_iso: Optional[str] = None
+    # Last-modified time, used as the record version for ETags
+    updated_at_iso: Optional[str] = None
     recruiter_id: Optional[uuid.UUID] = None
+    applicant: Optional[Applicant] = None
+    job_description: Optional[JobDescription] = None
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation time of the application"""
+        return parse_timestamp(self.created_at_iso)
+
+    @property
+    def deactive_at(self) -> Optional[datetime]:
+        """Deactivation time of the application, None while active"""
+        return parse_timestamp(self.deactive_at_iso)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert job application to dictionary"""
@@ -29,90 +51,182 @@ class ApplicantJobApply:
             "applicant_id": str(self.applicant_id),
             "job_description_id": str(self.job_description_id),
         }
-        if self.recruiter_id:
+        if self.recruiter_id is not None:
             data["recruiter_id"] = str(self.recruiter_id)
-        if self.id:
+        if self.id is not None:
             data["id"] = self.id
         return data
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ApplicantJobApply":
-        """Create ApplicantJobApply from dictionary"""
-        return cls(
-            id=data.get("id"),
-            applicant_id=uuid.UUID(data["applicant_id"]) if data.get("applicant_id") else None,
-            job_description_id=uuid.UUID(data["job_description_id"]) if data.get("job_description_id") else None,
-            recruiter_id=uuid.UUID(data["recruiter_id"]) if data.get("recruiter_id") else None,
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            deactive_at=datetime.fromisoformat(data["deactive_at"]) if data.get("deactive_at") else None,
-        )
+
+_from_dict, _from_rows = make_decoders(ApplicantJobApply, {
+    "id": None,
+    "applicant_id": fast_uuid,
+    "job_description_id": fast_uuid,
+    "recruiter_id": fast_uuid,
+    "created_at_iso": None,
+    "deactive_at_iso": None,
+    "updated_at_iso": None,
+    # Embedded rows from SELECT_WITH_RELATED
+    "applicant": Applicant.from_dict,
+    "job_description": JobDescription.from_dict,
+}, columns={
+    "created_at_iso": "created_at",
+    "deactive_at_iso": "deactive_at",
+    "updated_at_iso": "updated_at",
+})
+ApplicantJobApply.from_dict = staticmethod(_from_dict)
+ApplicantJobApply.from_rows = staticmethod(_from_rows)
 
 
 # Table name constant
 TABLE_NAME = "applicant_job_apply"
 
+# Columns read by ApplicantJobApply.from_dict; list queries request only these
+COLUMNS = "id,applicant_id,job_description_id,recruiter_id,created_at,deactive_at"
+
+# Select expression that embeds the related applicant and job description rows,
+# so a single PostgREST request returns the joined data
+SELECT_WITH_RELATED = (
+    f"{COLUMNS},applicant:{APPLICANTS_TABLE}({APPLICANT_COLUMNS}),"
+    f"job_description:{JOB_DESCRIPTIONS_TABLE}(*)"
+)
+
+# Single-record lookups, invalidated by update_record/delete_record
+_by_id_cache = record_cache(TABLE_NAME)
 
-def get_all_applications(include_inactive: bool = False) -> List[ApplicantJobApply]:
+
+def get_all_applications(
+    include_inactive: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[ApplicantJobApply]:
     """
     Get all job applications
     
     Args:
         include_inactive: If True, includes deactivated applications
+        limit: Maximum number of applications to return, ordered by ID
+            (optional, all by default)
+        offset: Applications to skip when limit is given (default: 0)
         
     Returns:
         List of ApplicantJobApply objects
     """
-    if include_inactive:
-        data = query_table(TABLE_NAME)
-    else:
-        # Only active applications (deactive_at is NULL)
-        data = query_table(TABLE_NAME, {"deactive_at": None})
+    return ApplicantJobApply.from_rows(get_application_rows(include_inactive, limit, offset))
+
+
+def get_application_rows(
+    include_inactive: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Get job applications as raw rows with the COLUMNS columns
+    
+    For read-only list responses: the rows are returned as decoded from
+    Supabase, without building ApplicantJobApply objects. They may be shared
+    with the query cache and must not be modified.
     
-    return [ApplicantJobApply.from_dict(record) for record in data]
+    Args:
+        include_inactive: If True, includes deactivated applications
+        limit: Maximum number of rows to return, ordered by ID
+            (optional, all by default)
+        offset: Rows to skip when limit is given (default: 0)
+        
+    Returns:
+        List of row dictionaries
+    """
+    # Only active applications (deactive_at is NULL) unless include_inactive
+    filters = None if include_inactive else {"deactive_at": None}
+    if limit is None:
+        return query_table(TABLE_NAME, filters, select=COLUMNS)
+    return query_table(
+        TABLE_NAME, filters, select=COLUMNS, limit=limit, offset=offset, order_by="id"
+    )
+
+
+def iter_all_applications(
+    include_inactive: bool = False,
+    page_size: int = 1000,
+) -> Iterator[ApplicantJobApply]:
+    """
+    Iterate over all job applications without loading them all at once
+    
+    Rows are fetched page by page and decoded one at a time, for exports and
+    other single-pass consumers of large result sets.
+    
+    Args:
+        include_inactive: If True, includes deactivated applications
+        page_size: Rows fetched per request
+        
+    Yields:
+        ApplicantJobApply objects ordered by ID
+    """
+    filters = None if include_inactive else {"deactive_at": None}
+    for record in iter_table(TABLE_NAME, filters, select=COLUMNS, page_size=page_size):
+        yield ApplicantJobApply.from_dict(record)
 
 
+@cached_record(TABLE_NAME, _by_id_cache)
 def get_application_by_id(application_id: int) -> Optional[ApplicantJobApply]:
     """
     Get a single job application by ID
     
+    Results are cached for 30 seconds in memory and, when Redis is configured,
+    for 5 minutes in Redis; writes through update_record and delete_record
+    evict both entries.
+    
     Args:
         application_id: Numeric ID of the application
         
     Returns:
         ApplicantJobApply object or None if not found
     """
-    data = query_table(TABLE_NAME, {"id": application_id})
-    if data:
-        return ApplicantJobApply.from_dict(data[0])
-    return None
+    record = shared_record(
+        TABLE_NAME,
+        application_id,
+        # All columns, so updated_at is included for the ETag
+        lambda: get_record_by_id(TABLE_NAME, application_id),
+    )
+    return ApplicantJobApply.from_dict(record) if record else None
 
 
-def get_applications_by_applicant(applicant_id: str) -> List[ApplicantJobApply]:
+def get_applications_by_applicant(
+    applicant_id: str,
+    select: str = SELECT_WITH_RELATED,
+) -> List[ApplicantJobApply]:
     """
     Get all applications for a specific applicant
     
     Args:
         applicant_id: UUID of the applicant
+        select: PostgREST select expression; embeds the applicant and job
+            description by default. Pass "*" to skip the join.
         
     Returns:
         List of ApplicantJobApply objects
     """
-    data = query_table(TABLE_NAME, {"applicant_id": applicant_id})
-    return [ApplicantJobApply.from_dict(record) for record in data]
+    data = query_table(TABLE_NAME, {"applicant_id": applicant_id}, select=select)
+    return ApplicantJobApply.from_rows(data)
 
 
-def get_applications_by_job(job_description_id: str) -> List[ApplicantJobApply]:
+def get_applications_by_job(
+    job_description_id: str,
+    select: str = SELECT_WITH_RELATED,
+) -> List[ApplicantJobApply]:
     """
     Get all applications for a specific job description
     
     Args:
         job_description_id: UUID of the job description
+        select: PostgREST select expression; embeds the applicant and job
+            description by default. Pass "*" to skip the join.
         
     Returns:
         List of ApplicantJobApply objects
     """
-    data = query_table(TABLE_NAME, {"job_description_id": job_description_id})
-    return [ApplicantJobApply.from_dict(record) for record in data]
+    data = query_table(TABLE_NAME, {"job_description_id": job_description_id}, select=select)
+    return ApplicantJobApply.from_rows(data)
 
 
 def search_applications(
@@ -131,7 +245,8 @@ def search_applications(
     Returns:
         List of matching ApplicantJobApply objects
     """
-    filters = {}
+    # Only active applications are searched
+    filters = {"deactive_at": None}
     if applicant_id:
         filters["applicant_id"] = applicant_id
     if job_description_id:
@@ -139,18 +254,26 @@ def search_applications(
     if recruiter_id:
         filters["recruiter_id"] = recruiter_id
     
-    # Default to active applications only
-    if "deactive_at" not in filters:
-        filters["deactive_at"] = None
-    
-    data = query_table(TABLE_NAME, filters if filters else None)
-    return [ApplicantJobApply.from_dict(record) for record in data]
+    data = query_table(TABLE_NAME, filters, select=COLUMNS)
+    return ApplicantJobApply.from_rows(data)
+
+
+def _apply_inserted(application: ApplicantJobApply, record: Dict[str, Any]) -> ApplicantJobApply:
+    """Copy the database-generated columns of an inserted row onto application"""
+    application.id = record["id"]
+    application.created_at_iso = record.get("created_at")
+    application.deactive_at_iso = record.get("deactive_at")
+    application.updated_at_iso = record.get("updated_at")
+    return application
 
 
 def create_application(application: ApplicantJobApply) -> ApplicantJobApply:
     """
     Create a new job application
     
+    The passed object is updated in place with the generated ID and
+    timestamps and returned, instead of re-parsing the inserted row.
+    
     Args:
         application: ApplicantJobApply object to create
         
@@ -161,10 +284,38 @@ def create_application(application: ApplicantJobApply) -> ApplicantJobApply:
     result = insert_record(TABLE_NAME, data)
     
     if result and len(result) > 0:
-        return ApplicantJobApply.from_dict(result[0])
+        return _apply_inserted(application, result[0])
     raise Exception("Failed to create job application")
 
 
+def create_applications(applications: List[ApplicantJobApply]) -> List[ApplicantJobApply]:
+    """
+    Create several job applications in a single request
+    
+    Like create_application, the passed objects are updated in place. The
+    rows are inserted by one statement, so either all are created or none.
+    
+    Args:
+        applications: ApplicantJobApply objects to create
+        
+    Returns:
+        Created ApplicantJobApply objects with IDs and timestamps
+    
+    Raises:
+        InvalidInput: an application references a missing applicant, job
+            description or recruiter
+    """
+    if not applications:
+        return []
+    
+    result = insert_record(TABLE_NAME, [a.to_dict() for a in applications])
+    
+    if result and len(result) == len(applications):
+        # Rows come back in insert order
+        return [_apply_inserted(a, record) for a, record in zip(applications, result)]
+    raise Exception("Failed to create job applications")
+
+
 def update_application(application_id: int, updates: Dict[str, Any]) -> Optional[ApplicantJobApply]:
     """
     Update a job application
@@ -176,11 +327,12 @@ def update_application(application_id: int, updates: Dict[str, Any]) -> Optional
     Returns:
         Updated ApplicantJobApply or None if not found
     """
-    result = update_record(TABLE_NAME, application_id, updates)
-    
-    if result and len(result) > 0:
-        return ApplicantJobApply.from_dict(result[0])
-    return None
+    return _first_application(update_record(TABLE_NAME, application_id, updates))
+
+
+def _first_application(result: List[Dict[str, Any]]) -> Optional[ApplicantJobApply]:
+    """Decode the first row of an update result, or None if no row matched"""
+    return ApplicantJobApply.from_dict(result[0]) if result else None
 
 
 def delete_application(application_id: int) -> bool:
@@ -207,8 +359,7 @@ def deactivate_application(application_id: int) -> Optional[ApplicantJobApply]:
     Returns:
         Updated ApplicantJobApply or None if not found
     """
-    updates = {"deactive_at": datetime.utcnow().isoformat()}
-    return update_application(application_id, updates)
+    return _first_application(update_record(TABLE_NAME, application_id, {"deactive_at": now_iso()}))
 
 
 def reactivate_application(application_id: int) -> Optional[ApplicantJobApply]:
@@ -221,8 +372,7 @@ def reactivate_application(application_id: int) -> Optional[ApplicantJobApply]:
     Returns:
         Updated ApplicantJobApply or None if not found
     """
-    updates = {"deactive_at": None}
-    return update_application(application_id, updates)
+    return _first_application(update_record(TABLE_NAME, application_id, {"deactive_at": None}))
 
 
 def assign_recruiter(application_id: int, recruiter_id: str) -> Optional[ApplicantJobApply]:
@@ -236,8 +386,7 @@ def assign_recruiter(application_id: int, recruiter_id: str) -> Optional[Applica
     Returns:
         Updated ApplicantJobApply or None if not found
     """
-    updates = {"recruiter_id": recruiter_id}
-    return update_application(application_id, updates)
+    return _first_application(update_record(TABLE_NAME, application_id, {"recruiter_id": recruiter_id}))
 
 
 def unassign_recruiter(application_id: int) -> Optional[ApplicantJobApply]:
@@ -250,5 +399,4 @@ def unassign_recruiter(application_id: int) -> Optional[ApplicantJobApply]:
     Returns:
         Updated ApplicantJobApply or None if not found
     """
-    updates = {"recruiter_id": None}
-    return update_application(application_id, updates)
+    return _first_application(update_record(TABLE_NAME, application_id, {"recruiter_id": None}))
@@ -11,13 +11,16 @@ for CRUD operations on the applicant_job_apply table.
 
 import uuid
 from applicant_job_apply import (
+    COLUMNS,
     ApplicantJobApply,
     get_all_applications,
+    iter_all_applications,
     get_application_by_id,
     get_applications_by_applicant,
     get_applications_by_job,
     search_applications,
     create_application,
+    create_applications,
     update_application,
     delete_application,
     deactivate_application,
@@ -36,6 +39,19 @@ new_application = ApplicantJobApply(
 created = create_application(new_application)
 print(f"Created application with ID: {created.id}")
 
+# Create several applications in a single request
+created_many = create_applications([
+    ApplicantJobApply(
+        applicant_id=uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
+        job_description_id=uuid.UUID("660e8400-e29b-41d4-a716-446655440001"),
+    ),
+    ApplicantJobApply(
+        applicant_id=uuid.UUID("550e8400-e29b-41d4-a716-446655440004"),
+        job_description_id=uuid.UUID("660e8400-e29b-41d4-a716-446655440001"),
+    ),
+])
+print(f"Created {len(created_many)} applications")
+
 # Get all active applications
 applications = get_all_applications()
 for app in applications:
@@ -44,6 +60,10 @@ for app in applications:
 # Get all applications including inactive
 all_applications = get_all_applications(include_inactive=True)
 
+# Stream every application page by page (e.g. for a CSV export)
+for app in iter_all_applications(include_inactive=True):
+    print(f"{app.id},{app.applicant_id},{app.job_description_id}")
+
 # Get a specific application by ID
 application = get_application_by_id(123)
 if application:
@@ -57,6 +77,13 @@ print(f"Applicant has {len(applicant_apps)} applications")
 job_apps = get_applications_by_job("660e8400-e29b-41d4-a716-446655440001")
 print(f"Job has {len(job_apps)} applications")
 
+# The related applicant and job description come back in the same request
+for app in job_apps:
+    print(f"{app.applicant.name} {app.applicant.last_name} -> {app.job_description.title}")
+
+# Skip the join when only the application rows are needed
+bare_apps = get_applications_by_job("660e8400-e29b-41d4-a716-446655440001", select=COLUMNS)
+
 # Search applications
 results = search_applications(
     applicant_id="550e8400-e29b-41d4-a716-446655440000",
@@ -111,28 +138,35 @@ delete_application(123)
 #   "recruiter_id": "770e8400-e29b-41d4-a716-446655440002"  # optional
 # }
 
-# 5. Update application
+# 5. Create several applications in one request
+# POST /api/applicant-job-applications/bulk
+# Body: [
+#   {"applicant_id": "550e8400-...", "job_description_id": "660e8400-..."},
+#   {"applicant_id": "550e8400-...", "job_description_id": "660e8400-...", "recruiter_id": "770e8400-..."}
+# ]
+
+# 6. Update application
 # PUT /api/applicant-job-applications/<id>
 # Body: {
 #   "recruiter_id": "880e8400-e29b-41d4-a716-446655440003"
 # }
 
-# 6. Delete application (permanent)
+# 7. Delete application (permanent)
 # DELETE /api/applicant-job-applications/<id>
 
-# 7. Deactivate (soft delete/withdraw)
+# 8. Deactivate (soft delete/withdraw)
 # POST /api/applicant-job-applications/<id>/deactivate
 
-# 8. Reactivate
+# 9. Reactivate
 # POST /api/applicant-job-applications/<id>/reactivate
 
-# 9. Assign recruiter
+# 10. Assign recruiter
 # POST /api/applicant-job-applications/<id>/assign-recruiter
 # Body: {
 #   "recruiter_id": "880e8400-e29b-41d4-a716-446655440003"
 # }
 
-# 10. Unassign recruiter
+# 11. Unassign recruiter
 # POST /api/applicant-job-applications/<id>/unassign-recruiter
 
 
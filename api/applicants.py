@@ -3,17 +3,22 @@ Applicants module - CRUD operations for the applicants table
 """
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from dataclasses import dataclass
+
+from .cache import cached_record, record_cache
 from .database import (
     query_table,
+    iter_table,
+    get_record_by_id,
     insert_record,
     update_record,
     delete_record,
 )
+from .utils import contains_pattern, fast_uuid, make_decoders, now_iso, parse_timestamp
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Applicant:
     """Applicant data model"""
     name: str
@@ -24,8 +29,19 @@ class Applicant:
     city: str
     english: str
     id: Optional[uuid.UUID] = None
-    created_at: Optional[datetime] = None
-    deactive_at: Optional[datetime] = None
+    # Raw timestamp strings; parsed only when created_at/deactive_at is accessed
+    created_at_iso: Optional[str] = None
+    deactive_at_iso: Optional[str] = None
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation time of the applicant"""
+        return parse_timestamp(self.created_at_iso)
+
+    @property
+    def deactive_at(self) -> Optional[datetime]:
+        """Deactivation time of the applicant, None while active"""
+        return parse_timestamp(self.deactive_at_iso)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert applicant to dictionary"""
@@ -38,30 +54,38 @@ class Applicant:
             "city": self.city,
             "english": self.english,
         }
-        if self.id:
+        if self.id is not None:
             data["id"] = str(self.id)
         return data
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Applicant":
-        """Create Applicant from dictionary"""
-        return cls(
-            id=uuid.UUID(data["id"]) if data.get("id") else None,
-            name=data["name"],
-            last_name=data["last_name"],
-            linkedin=data["linkedin"],
-            email=data["email"],
-            phone=data["phone"],
-            city=data["city"],
-            english=data["english"],
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            deactive_at=datetime.fromisoformat(data["deactive_at"]) if data.get("deactive_at") else None,
-        )
+
+_from_dict, _from_rows = make_decoders(Applicant, {
+    "id": fast_uuid,
+    "name": None,
+    "last_name": None,
+    "linkedin": None,
+    "email": None,
+    "phone": None,
+    "city": None,
+    "english": None,
+    "created_at_iso": None,
+    "deactive_at_iso": None,
+},
+    required=("name", "last_name", "linkedin", "email", "phone", "city", "english"),
+    columns={"created_at_iso": "created_at", "deactive_at_iso": "deactive_at"})
+Applicant.from_dict = staticmethod(_from_dict)
+Applicant.from_rows = staticmethod(_from_rows)
 
 
 # Table name constant
 TABLE_NAME = "applicants"
 
+# Columns read by Applicant.from_dict; list queries request only these
+COLUMNS = "id,name,last_name,linkedin,email,phone,city,english,created_at,deactive_at"
+
+# Single-record lookups, invalidated by update_record/delete_record
+_by_id_cache = record_cache(TABLE_NAME)
+
 
 def get_all_applicants(include_inactive: bool = False) -> List[Applicant]:
     """
@@ -74,28 +98,52 @@ def get_all_applicants(include_inactive: bool = False) -> List[Applicant]:
         List of Applicant objects
     """
     if include_inactive:
-        data = query_table(TABLE_NAME)
+        data = query_table(TABLE_NAME, select=COLUMNS)
     else:
         # Only active applicants (deactive_at is NULL)
-        data = query_table(TABLE_NAME, {"deactive_at": None})
+        data = query_table(TABLE_NAME, {"deactive_at": None}, select=COLUMNS)
+    
+    return Applicant.from_rows(data)
+
+
+def iter_all_applicants(
+    include_inactive: bool = False,
+    page_size: int = 1000,
+) -> Iterator[Applicant]:
+    """
+    Iterate over all applicants without loading them all at once
     
-    return [Applicant.from_dict(record) for record in data]
+    Rows are fetched page by page and decoded one at a time, for exports
+    and other single-pass consumers of large result sets.
+    
+    Args:
+        include_inactive: If True, includes deactivated applicants
+        page_size: Rows fetched per request
+        
+    Yields:
+        Applicant objects ordered by ID
+    """
+    filters = None if include_inactive else {"deactive_at": None}
+    for record in iter_table(TABLE_NAME, filters, select=COLUMNS, page_size=page_size):
+        yield Applicant.from_dict(record)
 
 
+@cached_record(TABLE_NAME, _by_id_cache)
 def get_applicant_by_id(applicant_id: str) -> Optional[Applicant]:
     """
     Get a single applicant by ID
     
+    Results are cached for 30 seconds; writes through update_record and
+    delete_record evict the entry.
+    
     Args:
         applicant_id: UUID of the applicant
         
     Returns:
         Applicant object or None if not found
     """
-    data = query_table(TABLE_NAME, {"id": applicant_id})
-    if data:
-        return Applicant.from_dict(data[0])
-    return None
+    record = get_record_by_id(TABLE_NAME, applicant_id, select=COLUMNS)
+    return Applicant.from_dict(record) if record else None
 
 
 def search_applicants(
@@ -122,25 +170,20 @@ def search_applicants(
     if english_level:
         filters["english"] = english_level
     
-    # Note: Partial matches for name and city would require ilike queries
-    # For now, using exact matches. Enhance with full-text search if needed.
-    
-    data = query_table(TABLE_NAME, filters if filters else {"deactive_at": None})
-    applicants = [Applicant.from_dict(record) for record in data]
-    
-    # Apply partial match filtering in Python for now
+    # Partial matches run in PostgreSQL (ILIKE), so only matching rows come back
+    ilike_filters = {}
     if name:
-        name_lower = name.lower()
-        applicants = [
-            a for a in applicants 
-            if name_lower in a.name.lower() or name_lower in a.last_name.lower()
-        ]
-    
+        ilike_filters[("name", "last_name")] = contains_pattern(name)
     if city:
-        city_lower = city.lower()
-        applicants = [a for a in applicants if city_lower in a.city.lower()]
+        ilike_filters["city"] = contains_pattern(city)
     
-    return applicants
+    data = query_table(
+        TABLE_NAME,
+        filters if filters else {"deactive_at": None},
+        select=COLUMNS,
+        ilike_filters=ilike_filters,
+    )
+    return Applicant.from_rows(data)
 
 
 def create_applicant(applicant: Applicant) -> Applicant:
@@ -203,7 +246,7 @@ def deactivate_applicant(applicant_id: str) -> Optional[Applicant]:
     Returns:
         Updated Applicant or None if not found
     """
-    updates = {"deactive_at": datetime.utcnow().isoformat()}
+    updates = {"deactive_at": now_iso()}
     return update_applicant(applicant_id, updates)
 
 
@@ -0,0 +1,468 @@
+"""
+Cache module - process-local TTL caches for read-heavy lookups
+
+Caches are registered per table so the database module can invalidate them on
+every write to that table. Each serverless instance keeps its own caches, so
+the TTL bounds how long another instance can serve a stale row.
+
+When REDIS_URL is set, single records can also be kept in Redis (shared_record),
+a second tier shared by all instances. Writes delete the Redis entry too, so
+other instances miss it and reload from Supabase.
+"""
+import functools
+import gzip
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Shared by all caches; held only for in-memory dict operations
+lock = threading.RLock()
+
+_table_caches: Dict[str, List[TTLCache]] = {}
+
+# List/search query results per table, cleared on any write to the table
+QUERY_CACHE_MAXSIZE = 1024
+QUERY_CACHE_TTL = 15
+_query_caches: Dict[str, TTLCache] = {}
+# Write generation per table, incremented by every invalidation. A result is
+# only stored if no write happened while it was loaded, so rows read before a
+# write cannot be put back after the write cleared the cache.
+_generations: Dict[str, int] = {}
+# Decoded list results per table (see list_cache), cleared with the query results
+_list_caches: Dict[str, List[TTLCache]] = {}
+
+# Gzipped response bodies keyed by a hash of the uncompressed body. An entry is
+# valid for as long as a response has that body, so the TTL only bounds memory.
+GZIP_CACHE_MAXSIZE = 256
+GZIP_CACHE_TTL = 60
+GZIP_LEVEL = 6
+_gzip_cache: TTLCache = TTLCache(maxsize=GZIP_CACHE_MAXSIZE, ttl=GZIP_CACHE_TTL)
+
+# Redis second tier (optional)
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_KEY_PREFIX = "ats:"
+REDIS_TIMEOUT = 0.25
+# After a Redis error the second tier is skipped for this many seconds, so an
+# unreachable Redis does not add a timeout to every request
+REDIS_RETRY_AFTER = 30
+# Records are stored prefixed with the write generations of their table and
+# of the record read before the record was loaded; like the lists below, a
+# record loaded before a write and stored after it is never served. Record
+# generation counters outlive any entry stored under them.
+SHARED_RECORD_TTL = 300
+RECORD_GENERATION_TTL = 2 * SHARED_RECORD_TTL
+# Serialized list responses per table, kept in one Redis hash per table so a
+# write drops them all with a single DEL. Each entry is prefixed with the
+# table's write generation (a counter incremented on every write) read before
+# the list was loaded, so a list loaded before a write and stored after it is
+# never served.
+SHARED_LIST_TTL = 60
+_redis = None
+_redis_down_until = 0.0
+
+
+def record_cache(table_name: str, maxsize: int = 4096, ttl: int = 30) -> TTLCache:
+    """
+    Create a TTL cache of single records, invalidated on writes to table_name
+
+    Args:
+        table_name: Table whose rows are cached
+        maxsize: Maximum number of cached records
+        ttl: Seconds before an entry expires
+
+    Returns:
+        TTLCache keyed by record_key(record_id)
+    """
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    _table_caches.setdefault(table_name, []).append(cache)
+    return cache
+
+
+def list_cache(table_name: str, maxsize: int = 16, ttl: int = QUERY_CACHE_TTL) -> TTLCache:
+    """
+    Create a TTL cache of decoded list results, cleared on any write to table_name
+
+    For lists read on most requests: a hit returns the decoded objects, so it
+    skips the query cache lookup and the row decoding as well. Cached lists are
+    shared between callers and must not be mutated.
+
+    Args:
+        table_name: Table the lists are read from
+        maxsize: Maximum number of cached lists
+        ttl: Seconds before an entry expires
+
+    Returns:
+        TTLCache for use with cachetools.cached
+    """
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    _list_caches.setdefault(table_name, []).append(cache)
+    return cache
+
+
+def cached_record(table_name: str, cache: TTLCache) -> Callable:
+    """
+    Decorator caching a single-record lookup in a record_cache() cache
+
+    Like cachetools.cached keyed by record_key, except that nothing is stored
+    when the record was not found (so a record created after a miss is found
+    on the next call) or when the table was written to while the record was
+    loaded.
+
+    Args:
+        table_name: Table the lookup reads
+        cache: Cache created with record_cache(table_name)
+
+    Returns:
+        Decorator for a function taking the record ID
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(record_id):
+            key = record_key(record_id)
+            with lock:
+                try:
+                    return cache[key]
+                except KeyError:
+                    pass
+                generation = _generations.get(table_name, 0)
+            result = func(record_id)
+            if result is not None:
+                with lock:
+                    if _generations.get(table_name, 0) == generation:
+                        cache[key] = result
+            return result
+        return wrapper
+    return decorator
+
+
+def record_key(record_id: Any) -> str:
+    """
+    Cache key for a record ID
+
+    Routes pass IDs as int or str depending on the converter, so keys are
+    normalized to str to make invalidation hit regardless of the caller.
+    """
+    return str(record_id)
+
+
+def cached_query(table_name: str, key: Hashable, load: Callable[[], Any]) -> Any:
+    """
+    Return a cached query result, loading and caching it on a miss
+
+    The result is shared between callers and must not be mutated. It is not
+    cached if the table was written to while it was loaded.
+
+    Args:
+        table_name: Table the query reads
+        key: Hashable description of the query (filters, select, ...)
+        load: Function running the query
+        
+    Returns:
+        Query result
+    """
+    with lock:
+        cache = _query_caches.get(table_name)
+        if cache is None:
+            cache = _query_caches[table_name] = TTLCache(
+                maxsize=QUERY_CACHE_MAXSIZE, ttl=QUERY_CACHE_TTL
+            )
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        generation = _generations.get(table_name, 0)
+    # Run the query without holding the lock
+    result = load()
+    with lock:
+        if _generations.get(table_name, 0) == generation:
+            cache[key] = result
+    return result
+
+
+def invalidate_queries(table_name: str) -> None:
+    """
+    Drop cached query results for a table, e.g. after an insert
+
+    Args:
+        table_name: Table that was written to
+    """
+    _clear_queries(table_name)
+    _shared_changed(table_name)
+
+
+def _clear_queries(table_name: str) -> None:
+    """Drop the in-process query results and decoded lists of a table"""
+    with lock:
+        _generations[table_name] = _generations.get(table_name, 0) + 1
+        cache = _query_caches.get(table_name)
+        if cache is not None:
+            cache.clear()
+        for cache in _list_caches.get(table_name, ()):
+            cache.clear()
+
+
+def invalidate(table_name: str, record_id: Any = None) -> None:
+    """
+    Drop cached entries for a table
+
+    Cached query results for the table are always cleared, since any change can
+    alter a list or search result. Records and lists kept in Redis are deleted
+    as well.
+
+    Args:
+        table_name: Table that was written to
+        record_id: ID of the changed record, or None to clear everything cached
+            for the table
+    """
+    _clear_queries(table_name)
+    with lock:
+        for cache in _table_caches.get(table_name, ()):
+            if record_id is None:
+                cache.clear()
+            else:
+                cache.pop(record_key(record_id), None)
+    if record_id is None:
+        shared_delete_matching(f"{table_name}:*")
+    _shared_changed(table_name, record_id, records=True)
+
+
+def redis_client():
+    """
+    Return the Redis client, or None when Redis is not configured or failing
+
+    The redis package is only imported when REDIS_URL is set.
+    """
+    global _redis
+    if not REDIS_URL or time.monotonic() < _redis_down_until:
+        return None
+    if _redis is None:
+        with lock:
+            if _redis is None:
+                import redis
+                _redis = redis.Redis.from_url(
+                    REDIS_URL,
+                    socket_timeout=REDIS_TIMEOUT,
+                    socket_connect_timeout=REDIS_TIMEOUT,
+                )
+    return _redis
+
+
+def redis_failed(error: Exception) -> None:
+    """Log a Redis error and skip Redis for REDIS_RETRY_AFTER seconds"""
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_AFTER
+    logger.warning("redis unavailable, retrying in %ss: %s", REDIS_RETRY_AFTER, error)
+
+
+def shared_set(key: str, value: bytes, ttl: int) -> None:
+    """
+    Store a value in Redis for ttl seconds (no-op when Redis is unavailable)
+
+    Args:
+        key: Key without REDIS_KEY_PREFIX
+        value: Bytes to store
+        ttl: Seconds before the entry expires
+    """
+    client = redis_client()
+    if client is None:
+        return
+    try:
+        client.setex(REDIS_KEY_PREFIX + key, ttl, value)
+    except Exception as e:
+        redis_failed(e)
+
+
+def shared_delete(*keys: str) -> None:
+    """Delete keys (without REDIS_KEY_PREFIX) from Redis"""
+    client = redis_client()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*(REDIS_KEY_PREFIX + key for key in keys))
+    except Exception as e:
+        redis_failed(e)
+
+
+def shared_delete_matching(pattern: str) -> None:
+    """Delete the Redis keys matching a glob pattern (without REDIS_KEY_PREFIX)"""
+    client = redis_client()
+    if client is None:
+        return
+    try:
+        keys = list(client.scan_iter(REDIS_KEY_PREFIX + pattern, count=500))
+        if keys:
+            client.delete(*keys)
+    except Exception as e:
+        redis_failed(e)
+
+
+def shared_record(table_name: str, record_id: Any, load: Callable[[], Optional[dict]]) -> Optional[dict]:
+    """
+    Return a record from Redis, loading and storing it on a miss
+
+    Use it inside a function cached with record_cache() for a two-tier lookup:
+    process memory first, then Redis, then Supabase. Without REDIS_URL this
+    just calls load. The entry and the write generations are read in one
+    round-trip; an entry from before the last write is a miss.
+
+    Args:
+        table_name: Table of the record
+        record_id: ID of the record
+        load: Function fetching the record from the database (None if missing)
+
+    Returns:
+        Record dictionary or None if not found
+    """
+    key = f"{table_name}:{record_key(record_id)}"
+    generation = None
+    client = redis_client()
+    if client is not None:
+        try:
+            pipe = client.pipeline(transaction=False)
+            for generation_key in _generation_keys(table_name, record_id):
+                pipe.get(generation_key)
+            pipe.get(REDIS_KEY_PREFIX + key)
+            table_generation, record_generation, value = pipe.execute()
+        except Exception as e:
+            redis_failed(e)
+        else:
+            generation = b"%d.%d" % (int(table_generation or 0), int(record_generation or 0))
+            if value is not None:
+                stored, _, body = value.partition(b":")
+                if stored == generation:
+                    return orjson.loads(body)
+    record = load()
+    if record is not None and generation is not None:
+        shared_set(key, generation + b":" + orjson.dumps(record), SHARED_RECORD_TTL)
+    return record
+
+
+def gzipped(digest: str, body: bytes) -> bytes:
+    """
+    Return body gzip-compressed, reusing the result for repeated bodies
+
+    List endpoints serve the same cached rows until a write or the query TTL,
+    so repeated requests reuse one compression instead of redoing it per hit.
+
+    Args:
+        digest: Hash of body identifying it (e.g. the response ETag)
+        body: Uncompressed bytes
+
+    Returns:
+        gzip-compressed body
+    """
+    with lock:
+        compressed = _gzip_cache.get(digest)
+    if compressed is None:
+        compressed = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        with lock:
+            _gzip_cache[digest] = compressed
+    return compressed
+
+
+def _generation_keys(table_name: str, record_id: Any) -> Tuple[str, str]:
+    """Redis keys of the record write generations of a table and of one of its records"""
+    return (
+        f"{REDIS_KEY_PREFIX}records-generation:{table_name}",
+        f"{REDIS_KEY_PREFIX}records-generation:{table_name}:{record_key(record_id)}",
+    )
+
+
+def _shared_changed(table_name: str, record_id: Any = None, records: bool = False) -> None:
+    """
+    Start new write generations in Redis after a write to a table
+
+    The shared lists of the table always get a new generation and are dropped.
+    With records, so do the record record_id or, when it is None, all records
+    of the table (their entries are deleted by the caller).
+    """
+    client = redis_client()
+    if client is None:
+        return
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.incr(f"{REDIS_KEY_PREFIX}lists-generation:{table_name}")
+        pipe.delete(f"{REDIS_KEY_PREFIX}{table_name}:lists")
+        if records:
+            table_generation, record_generation = _generation_keys(table_name, record_id)
+            if record_id is None:
+                pipe.incr(table_generation)
+            else:
+                pipe.delete(f"{REDIS_KEY_PREFIX}{table_name}:{record_key(record_id)}")
+                pipe.incr(record_generation)
+                pipe.expire(record_generation, RECORD_GENERATION_TTL)
+        pipe.execute()
+    except Exception as e:
+        redis_failed(e)
+
+
+def shared_list_get(table_name: str, key: str) -> Tuple[Optional[bytes], Optional[int]]:
+    """
+    Read a serialized list response from Redis
+
+    A value for shared_list_set must be loaded from the database, not from the
+    in-process query cache: that may still hold rows from before a write made
+    on another instance.
+
+    Args:
+        table_name: Table the list reads
+        key: Description of the request (filters, page, format)
+
+    Returns:
+        (body, generation): body is None on a miss; generation is the write
+        generation to pass to shared_list_set, or None when Redis is
+        unavailable
+    """
+    client = redis_client()
+    if client is None:
+        return None, None
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.get(f"{REDIS_KEY_PREFIX}lists-generation:{table_name}")
+        pipe.hget(f"{REDIS_KEY_PREFIX}{table_name}:lists", key)
+        current, value = pipe.execute()
+    except Exception as e:
+        redis_failed(e)
+        return None, None
+    generation = int(current or 0)
+    if value is not None:
+        stored, _, body = value.partition(b":")
+        if int(stored) == generation:
+            return body, generation
+    return None, generation
+
+
+def shared_list_set(table_name: str, key: str, body: bytes, generation: int) -> None:
+    """
+    Store a serialized list response in Redis until the next write to the table
+
+    The entries of a table expire together SHARED_LIST_TTL seconds after the
+    first one was stored, which bounds staleness from changes made outside
+    the API.
+
+    Args:
+        table_name: Table the list reads
+        key: Description of the request (filters, page, format)
+        body: Response body
+        generation: Generation returned by the shared_list_get call made
+            before the list was loaded; if a write happened since, the entry
+            is never served
+    """
+    client = redis_client()
+    if client is None:
+        return
+    name = f"{REDIS_KEY_PREFIX}{table_name}:lists"
+    try:
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(name, key, b"%d:" % generation + body)
+        pipe.expire(name, SHARED_LIST_TTL, nx=True)
+        pipe.execute()
+    except Exception as e:
+        redis_failed(e)
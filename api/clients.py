@@ -5,22 +5,37 @@ import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
+
+from .cache import cached_record, record_cache
 from .database import (
     query_table,
+    get_record_by_id,
     insert_record,
     update_record,
     delete_record,
 )
+from .utils import contains_pattern, fast_uuid, make_decoders, now_iso, parse_timestamp
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Client:
     """Client data model"""
     name: Optional[str] = None
     description: Optional[str] = None
     id: Optional[uuid.UUID] = None
-    created_at: Optional[datetime] = None
-    deactive: Optional[datetime] = None
+    # Raw timestamp strings; parsed only when created_at/deactive is accessed
+    created_at_iso: Optional[str] = None
+    deactive_iso: Optional[str] = None
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation time of the client"""
+        return parse_timestamp(self.created_at_iso)
+
+    @property
+    def deactive(self) -> Optional[datetime]:
+        """Deactivation time of the client, None while active"""
+        return parse_timestamp(self.deactive_iso)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert client to dictionary"""
@@ -29,25 +44,31 @@ class Client:
             data["name"] = self.name
         if self.description is not None:
             data["description"] = self.description
-        if self.id:
+        if self.id is not None:
             data["id"] = str(self.id)
         return data
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Client":
-        """Create Client from dictionary"""
-        return cls(
-            id=uuid.UUID(data["id"]) if data.get("id") else None,
-            name=data.get("name"),
-            description=data.get("description"),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            deactive=datetime.fromisoformat(data["deactive"]) if data.get("deactive") else None,
-        )
+
+_from_dict, _from_rows = make_decoders(Client, {
+    "id": fast_uuid,
+    "name": None,
+    "description": None,
+    "created_at_iso": None,
+    "deactive_iso": None,
+}, columns={"created_at_iso": "created_at", "deactive_iso": "deactive"})
+Client.from_dict = staticmethod(_from_dict)
+Client.from_rows = staticmethod(_from_rows)
 
 
 # Table name constant
 TABLE_NAME = "client"
 
+# Columns read by Client.from_dict; list queries request only these
+COLUMNS = "id,name,description,created_at,deactive"
+
+# Single-record lookups, invalidated by update_record/delete_record
+_by_id_cache = record_cache(TABLE_NAME)
+
 
 def get_all_clients(include_inactive: bool = False) -> List[Client]:
     """
@@ -60,28 +81,30 @@ def get_all_clients(include_inactive: bool = False) -> List[Client]:
         List of Client objects
     """
     if include_inactive:
-        data = query_table(TABLE_NAME)
+        data = query_table(TABLE_NAME, select=COLUMNS)
     else:
         # Only active clients (deactive is NULL)
-        data = query_table(TABLE_NAME, {"deactive": None})
+        data = query_table(TABLE_NAME, {"deactive": None}, select=COLUMNS)
     
-    return [Client.from_dict(record) for record in data]
+    return Client.from_rows(data)
 
 
+@cached_record(TABLE_NAME, _by_id_cache)
 def get_client_by_id(client_id: str) -> Optional[Client]:
     """
     Get a single client by ID
     
+    Results are cached for 30 seconds; writes through update_record and
+    delete_record evict the entry.
+    
     Args:
         client_id: UUID of the client
         
     Returns:
         Client object or None if not found
     """
-    data = query_table(TABLE_NAME, {"id": client_id})
-    if data:
-        return Client.from_dict(data[0])
-    return None
+    record = get_record_by_id(TABLE_NAME, client_id, select=COLUMNS)
+    return Client.from_dict(record) if record else None
 
 
 def search_clients(name: Optional[str] = None, description: Optional[str] = None) -> List[Client]:
@@ -95,26 +118,15 @@ def search_clients(name: Optional[str] = None, description: Optional[str] = None
     Returns:
         List of matching Client objects
     """
-    # Get all active clients first
-    data = query_table(TABLE_NAME, {"deactive": None})
-    clients = [Client.from_dict(record) for record in data]
-    
-    # Apply partial match filtering in Python
+    # Partial matches run in PostgreSQL (ILIKE), so only matching rows come back
+    ilike_filters = {}
     if name:
-        name_lower = name.lower()
-        clients = [
-            c for c in clients 
-            if c.name and name_lower in c.name.lower()
-        ]
-    
+        ilike_filters["name"] = contains_pattern(name)
     if description:
-        desc_lower = description.lower()
-        clients = [
-            c for c in clients 
-            if c.description and desc_lower in c.description.lower()
-        ]
+        ilike_filters["description"] = contains_pattern(description)
     
-    return clients
+    data = query_table(TABLE_NAME, {"deactive": None}, select=COLUMNS, ilike_filters=ilike_filters)
+    return Client.from_rows(data)
 
 
 def create_client(client: Client) -> Client:
@@ -181,7 +193,7 @@ def deactivate_client(client_id: str) -> Optional[Client]:
     Returns:
         Updated Client or None if not found
     """
-    updates = {"deactive": datetime.utcnow().isoformat()}
+    updates = {"deactive": now_iso()}
     return update_client(client_id, updates)
 
 
@@ -1,19 +1,77 @@
 """
 Database module for Supabase integration
 """
+import logging
 import os
-from supabase import create_client, Client
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+import httpx
+import orjson
+from postgrest.exceptions import APIError
+from postgrest.utils import sanitize_param
+from supabase import create_client, Client, ClientOptions
 from dotenv import load_dotenv
 
+from .cache import cached_query, invalidate, invalidate_queries
+from .utils import InvalidInput
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Supabase configuration
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
+# HTTP settings for PostgREST requests. Connections are kept alive and
+# multiplexed over HTTP/2 so warm instances skip the TCP + TLS handshake;
+# failed connection attempts are retried (requests that reached the server are not).
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=2.0)
+HTTP_LIMITS = httpx.Limits(max_connections=60, max_keepalive_connections=40, keepalive_expiry=60)
+HTTP_CONNECT_RETRIES = 2
+
+# Accept header asking PostgREST for one JSON object instead of an array, and
+# the error code it answers with when no row matches
+SINGLE_OBJECT = "application/vnd.pgrst.object+json"
+NO_ROWS = "PGRST116"
+# Error code of a write naming a column the table does not have
+UNKNOWN_COLUMN = "PGRST204"
+# PostgreSQL errors of an insert rejected because of the client's data,
+# answered with these messages instead of the constraint names
+INVALID_INSERT = {
+    "23503": "A referenced record does not exist",
+    "23505": "A record with the same unique values already exists",
+}
+
+# Headers of writes sending an orjson-encoded body and reading back the rows
+WRITE_HEADERS = {"Content-Type": "application/json", "Prefer": "return=representation"}
+
 # Initialize Supabase client
 supabase: Client = None
+_client_lock = threading.Lock()
+
+# Worker threads for overlapping independent Supabase requests made while
+# handling a single API request (see run_concurrently)
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="supabase")
+
+
+def _create_http_client() -> httpx.Client:
+    """
+    Create the pooled HTTP client shared by all Supabase requests
+    
+    Returns:
+        httpx.Client with keep-alive, HTTP/2 and connection retries
+    """
+    return httpx.Client(
+        transport=httpx.HTTPTransport(http2=True, limits=HTTP_LIMITS, retries=HTTP_CONNECT_RETRIES),
+        timeout=HTTP_TIMEOUT,
+        follow_redirects=True,
+    )
+
 
 def get_supabase_client() -> Client:
     """
@@ -25,64 +83,354 @@ def get_supabase_client() -> Client:
     global supabase
     
     if supabase is None:
-        if not SUPABASE_URL or not SUPABASE_KEY:
-            raise ValueError(
-                "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
-            )
-        supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
+        with _client_lock:
+            if supabase is None:
+                if not SUPABASE_URL or not SUPABASE_KEY:
+                    raise ValueError(
+                        "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
+                    )
+                supabase = create_client(
+                    SUPABASE_URL,
+                    SUPABASE_KEY,
+                    options=ClientOptions(httpx_client=_create_http_client()),
+                )
     
     return supabase
 
 
-def query_table(table_name: str, filters: dict = None):
+def reset_supabase_client() -> None:
+    """
+    Drop the Supabase client so the next call creates a new one
+    
+    Requests already running on the old client finish on its connections.
+    """
+    global supabase
+    
+    with _client_lock:
+        supabase = None
+
+
+def _rest_request(method: str, table_name: str, **kwargs) -> Any:
+    """
+    Send a request straight to the PostgREST endpoint of a table
+    
+    Used instead of the query builder: the request is sent on the Supabase
+    client's HTTP session and the JSON response is decoded with orjson without
+    building the client's response models.
+    
+    Args:
+        method: HTTP method
+        table_name: Name of the table
+        **kwargs: Passed to httpx (params, content, headers)
+        
+    Returns:
+        Decoded response body
+        
+    Raises:
+        APIError: PostgREST returned an error
+    """
+    postgrest = get_supabase_client().postgrest
+    headers = postgrest.headers.copy()
+    headers.update(kwargs.pop("headers", {}))
+    try:
+        response = postgrest.session.request(
+            method, str(postgrest.base_url.joinpath(table_name)), headers=headers, **kwargs
+        )
+    except httpx.RemoteProtocolError:
+        # The server dropped a pooled connection in a way the pool did not
+        # recover from: rebuild the client so later requests start from fresh
+        # connections, and re-raise since the request may have been applied
+        reset_supabase_client()
+        raise
+    if not response.is_success:
+        try:
+            error = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            error = {"message": response.text}
+        raise APIError(error if isinstance(error, dict) else {"message": str(error)})
+    return orjson.loads(response.content)
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent database calls in parallel
+    
+    The blocking calls run on worker threads and share the pooled HTTP/2
+    connection, so a handler that needs several unrelated queries waits for
+    the slowest one instead of their sum.
+    
+    Args:
+        *calls: Zero-argument callables, e.g. functools.partial(query_table, "client")
+        
+    Returns:
+        Results in the same order as calls; the first exception raised by a
+        call is re-raised
+    """
+    if len(calls) < 2:
+        return [call() for call in calls]
+    futures = [_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
+
+def query_table(
+    table_name: str,
+    filters: dict = None,
+    select: str = "*",
+    ilike_filters: dict = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    order_by: Optional[str] = None,
+    range_filters: dict = None,
+    use_cache: bool = True,
+):
     """
     Query a table with optional filters
     
     Args:
         table_name: Name of the table to query
-        filters: Dictionary of column:value pairs to filter by (optional)
+        filters: Dictionary of column:value pairs to filter by (optional). A list
+            value matches any of its items (column IN (...))
+        select: PostgREST select expression, e.g. "*,applicant:applicants(*)"
+            to embed related rows in the same request (default: "*")
+        ilike_filters: Dictionary of column:pattern pairs matched case-insensitively
+            by PostgreSQL (optional). A tuple of columns as key matches if any
+            of them matches, e.g. {("name", "last_name"): "%ana%"}
+        limit: Maximum number of rows to return (optional, all rows by default)
+        offset: Rows to skip before the first returned row (default: 0)
+        order_by: Column to sort by (optional); give a unique column when
+            paging with limit/offset so pages do not overlap
+        range_filters: Dictionary of column:[(operator, value), ...] comparisons
+            applied by PostgreSQL (optional); operators are "gt", "gte", "lt"
+            and "lte", e.g. {"min_salary": [("gte", 1000), ("lte", 5000)]}
+        use_cache: False to read from the database even if the in-process
+            query cache holds a result, e.g. for a value shared with other
+            instances (default: True)
         
     Returns:
-        Query result data
+        Query result data (cached for a few seconds per query; do not mutate)
     """
-    client = get_supabase_client()
-    query = client.table(table_name).select("*")
+    key = (
+        select,
+        _freeze(filters),
+        _freeze(ilike_filters),
+        _freeze(range_filters),
+        order_by,
+        limit,
+        offset,
+    )
+    
+    def load():
+        params = _query_params(select, key[1], key[2], key[3])
+        if order_by:
+            params += (("order", order_by),)
+        if limit is not None:
+            params += (("limit", str(limit)), ("offset", str(offset)))
+        return _rest_request("GET", table_name, params=params)
+    
+    # Embedded resources read other tables, whose writes would not invalidate
+    # this table's cached results
+    if "(" in select or not use_cache:
+        return load()
+    return cached_query(table_name, key, load)
+
+
+def get_record_by_id(table_name: str, record_id, select: str = "*") -> Optional[dict]:
+    """
+    Fetch a single record by ID
+    
+    PostgREST is asked for a single JSON object instead of an array, and
+    answers 406 (NO_ROWS) when nothing matches.
+    
+    Args:
+        table_name: Name of the table
+        record_id: ID of the record (int or str for UUID)
+        select: PostgREST select expression (default: "*")
+        
+    Returns:
+        Record dictionary or None if not found
+    """
+    try:
+        return _rest_request(
+            "GET",
+            table_name,
+            params=(("select", select), ("id", f"eq.{record_id}")),
+            headers={"Accept": SINGLE_OBJECT},
+        )
+    except APIError as e:
+        if e.code == NO_ROWS:
+            return None
+        raise
+
+
+def iter_table(
+    table_name: str,
+    filters: dict = None,
+    select: str = "*",
+    page_size: int = 1000,
+    order_by: str = "id",
+) -> Iterator[dict]:
+    """
+    Iterate over the rows of a table, fetching them page by page
+    
+    Only one page of rows is held in memory at a time, which keeps exports of
+    large tables from materializing the whole result.
+    
+    Args:
+        table_name: Name of the table to query
+        filters: Dictionary of column:value pairs to filter by (optional)
+        select: PostgREST select expression (default: "*")
+        page_size: Rows fetched per request (default: 1000, the PostgREST
+            max-rows default on Supabase)
+        order_by: Unique column giving pages a stable order (default: "id")
+        
+    Yields:
+        Row dictionaries
+    """
+    params = _query_params(select, _freeze(filters), None) + (("order", order_by),)
+    start = 0
+    while True:
+        page = params + (("offset", str(start)), ("limit", str(page_size)))
+        rows = _rest_request("GET", table_name, params=page)
+        yield from rows
+        if len(rows) < page_size:
+            return
+        start += page_size
+
+
+def _freeze(filters: Optional[dict]):
+    """Hashable form of a filters dict (lists become tuples), None when empty"""
+    if not filters:
+        return None
+    return frozenset(
+        (column, tuple(value) if isinstance(value, list) else value)
+        for column, value in filters.items()
+    )
+
+
+# Comparison operators accepted in query_table's range_filters
+RANGE_OPERATORS = frozenset({"gt", "gte", "lt", "lte"})
+
+
+@lru_cache(maxsize=256)
+def _query_params(
+    select: str, filters, ilike_filters, range_filters=None
+) -> Tuple[Tuple[str, str], ...]:
+    """
+    Translate a select expression and frozen filters into PostgREST query parameters
+    
+    Cached, so repeated query shapes skip the translation. Filters follow
+    query_table: None -> is.null, tuple -> in.(...), other values -> eq; a
+    tuple of columns in ilike_filters becomes one or=(...) parameter; each
+    (operator, value) in range_filters becomes column=operator.value.
+    """
+    params = [("select", select)]
     
     if filters:
-        for column, value in filters.items():
+        for column, value in filters:
             if value is None:
-                query = query.is_(column, None)
+                params.append((column, "is.null"))
+            elif isinstance(value, tuple):
+                # Any of several values in one request: column=in.(a,b,c)
+                params.append((column, f"in.({','.join(sanitize_param(v) for v in value)})"))
+            else:
+                params.append((column, f"eq.{value}"))
+    
+    if ilike_filters:
+        for column, pattern in ilike_filters:
+            if isinstance(column, tuple):
+                # Quote the pattern so commas/parentheses in user input
+                # cannot break the or=(...) expression
+                quoted = pattern.replace("\\", "\\\\").replace('"', '\\"')
+                matches = ",".join(f'{c}.ilike."{quoted}"' for c in column)
+                params.append(("or", f"({matches})"))
             else:
-                query = query.eq(column, value)
+                params.append((column, f"ilike.{pattern}"))
     
-    response = query.execute()
-    return response.data
+    if range_filters:
+        for column, comparisons in range_filters:
+            for operator, value in comparisons:
+                if operator not in RANGE_OPERATORS:
+                    raise ValueError(f"Unsupported range operator: {operator}")
+                params.append((column, f"{operator}.{value}"))
+    
+    return tuple(params)
 
 
-def insert_record(table_name: str, data: dict):
+def insert_record(table_name: str, data: Union[dict, List[dict]]):
     """
     Insert a new record into a table
     
+    The rows are encoded with orjson and sent through insert_raw.
+    
     Args:
         table_name: Name of the table
-        data: Dictionary of data to insert
+        data: Dictionary of data to insert, or a list of dictionaries to insert
+            all rows in a single request (one INSERT statement, all or nothing)
         
     Returns:
         Inserted record data
     """
-    client = get_supabase_client()
+    columns = None
+    if isinstance(data, list):
+        columns = dict.fromkeys(key for row in data for key in row)
+    return insert_raw(table_name, orjson.dumps(data), columns)
+
+
+def insert_raw(table_name: str, body: bytes, columns: Optional[Iterable[str]] = None):
+    """
+    Insert records from an already encoded JSON body
+    
+    The request body received by the API is forwarded to PostgREST as is and
+    the response is decoded with orjson, skipping the re-encoding of the
+    rows and the response validation done by the Supabase client.
+    
+    Args:
+        table_name: Name of the table
+        body: JSON object or array of objects, as bytes
+        columns: Columns to insert when body is an array whose objects do not
+            all have the same keys (missing values use the column default)
+        
+    Returns:
+        Inserted record data (a list, as with insert_record)
+        
+    Raises:
+        InvalidInput: a record has a key that is not a column of the table,
+            references a missing row or duplicates a unique value; the
+            insert is one statement, so no record was created
+    """
+    params = {"columns": ",".join(f'"{c}"' for c in columns)} if columns else None
     try:
-        response = client.table(table_name).insert(data).execute()
-        return response.data
+        result = _rest_request(
+            "POST",
+            table_name,
+            content=body,
+            headers=WRITE_HEADERS,
+            params=params,
+        )
+        invalidate_queries(table_name)
+        return result
+    except APIError as e:
+        if e.code == UNKNOWN_COLUMN:
+            # PostgREST names the unknown key, which the client sent
+            raise InvalidInput(e.message) from None
+        if e.code in INVALID_INSERT:
+            raise InvalidInput(INVALID_INSERT[e.code]) from None
+        raise _insert_error(table_name, e)
     except Exception as e:
-        import traceback
-        import sys
-        error_msg = f"Error inserting into {table_name}: {str(e)}"
-        print(f"[DATABASE ERROR] {error_msg}", file=sys.stderr)
-        print(f"[DATABASE ERROR] Data: {data}", file=sys.stderr)
-        print(f"[DATABASE ERROR] Traceback:\n{traceback.format_exc()}", file=sys.stderr)
-        sys.stderr.flush()
-        raise Exception(error_msg)
+        raise _insert_error(table_name, e)
+
+
+def _insert_error(table_name: str, error: Exception) -> Exception:
+    """
+    Log a failed insert and build the exception raised to the caller
+    
+    Must be called from the except block handling error. The row data is not
+    logged since it holds personal data; the traceback is only formatted if a
+    handler emits the record.
+    """
+    logger.exception("insert failed table=%s", table_name)
+    return Exception(f"Error inserting into {table_name}: {str(error)}")
 
 
 def update_record(table_name: str, record_id, data: dict):
@@ -97,9 +445,41 @@ def update_record(table_name: str, record_id, data: dict):
     Returns:
         Updated record data
     """
-    client = get_supabase_client()
-    response = client.table(table_name).update(data).eq("id", record_id).execute()
-    return response.data
+    result = _rest_request(
+        "PATCH",
+        table_name,
+        content=orjson.dumps(data),
+        headers=WRITE_HEADERS,
+        params={"id": f"eq.{record_id}"},
+    )
+    invalidate(table_name, record_id)
+    return result
+
+
+def call_function(function_name: str, params: dict, table_name: str):
+    """
+    Call a PostgreSQL function through the PostgREST RPC endpoint
+    
+    For writes that would otherwise take one request per row; the function
+    runs as a single statement in one transaction.
+    
+    Args:
+        function_name: Name of the function (see supabase/migrations)
+        params: Arguments of the function by name
+        table_name: Table the function writes to; its cached entries are
+            dropped afterwards
+        
+    Returns:
+        Function result (the rows, for functions returning SETOF a table)
+    """
+    result = _rest_request(
+        "POST",
+        f"rpc/{function_name}",
+        content=orjson.dumps(params),
+        headers={"Content-Type": "application/json"},
+    )
+    invalidate(table_name)
+    return result
 
 
 def delete_record(table_name: str, record_id):
@@ -113,6 +493,16 @@ def delete_record(table_name: str, record_id):
     Returns:
         Deleted record data
     """
-    client = get_supabase_client()
-    response = client.table(table_name).delete().eq("id", record_id).execute()
-    return response.data
+    result = _rest_request(
+        "DELETE",
+        table_name,
+        headers={"Prefer": "return=representation"},
+        params={"id": f"eq.{record_id}"},
+    )
+    invalidate(table_name, record_id)
+    return result
+
+
+# Build the client during the cold start instead of on the first request
+if SUPABASE_URL and SUPABASE_KEY:
+    get_supabase_client()
@@ -1,14 +1,31 @@
 """
 Main Flask application for Vercel serverless deployment
 """
+import hashlib
+import logging
 import uuid
-from flask import Flask, request, jsonify
+import orjson
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
+from werkzeug.routing import AnyConverter, BaseConverter
 import os
-from .database import query_table, insert_record, update_record, delete_record
+import re
+from .database import (
+    query_table,
+    get_record_by_id,
+    insert_raw,
+    update_record,
+    delete_record,
+    run_concurrently,
+)
+from .cache import gzipped, shared_list_get, shared_list_set
+from .serialization import OrjsonProvider, fast_dumps, make_encoders, passthrough_encoders
+from .utils import InvalidInput
 from .applicants import (
     Applicant,
     get_all_applicants,
+    iter_all_applicants,
     get_applicant_by_id,
     search_applicants,
     create_applicant,
@@ -16,6 +33,7 @@ from .applicants import (
     delete_applicant,
     deactivate_applicant,
     reactivate_applicant,
+    TABLE_NAME as APPLICANTS_TABLE,
 )
 from .clients import (
     Client,
@@ -27,10 +45,12 @@ from .clients import (
     delete_client,
     deactivate_client,
     reactivate_client,
+    TABLE_NAME as CLIENTS_TABLE,
 )
 from .recruiters import (
     Recruiter,
     get_all_recruiters,
+    get_recruiter_rows,
     get_recruiter_by_id,
     search_recruiters,
     create_recruiter,
@@ -38,10 +58,14 @@ from .recruiters import (
     delete_recruiter,
     deactivate_recruiter,
     reactivate_recruiter,
+    COLUMNS as RECRUITER_COLUMNS,
+    TABLE_NAME as RECRUITERS_TABLE,
 )
 from .job_descriptions import (
     JobDescription,
     get_all_job_descriptions,
+    get_job_description_rows,
+    iter_all_job_descriptions,
     get_job_description_by_id,
     search_job_descriptions,
     create_job_description,
@@ -50,38 +74,340 @@ from .job_descriptions import (
     close_job_description,
     reopen_job_description,
     change_job_status,
+    COLUMNS as JOB_DESCRIPTION_ROW_COLUMNS,
+    TABLE_NAME as JOB_DESCRIPTIONS_TABLE,
 )
 from .applicant_job_apply import (
     ApplicantJobApply,
-    get_all_applications,
+    get_application_rows,
+    iter_all_applications,
     get_application_by_id,
     get_applications_by_applicant,
     get_applications_by_job,
     search_applications,
     create_application,
+    create_applications,
     update_application,
     delete_application,
     deactivate_application,
     reactivate_application,
     assign_recruiter,
     unassign_recruiter,
+    COLUMNS as APPLICATION_ROW_COLUMNS,
+    TABLE_NAME as APPLICATIONS_TABLE,
+)
+
+# Log to stderr, which Vercel collects; LOG_LEVEL sets the threshold
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(levelname)s %(name)s: %(message)s",
 )
+# httpx logs every request URL at INFO; Supabase URLs carry filter values
+# (search terms, emails), so only its warnings are kept
+logging.getLogger("httpx").setLevel(logging.WARNING)
+logging.getLogger("httpcore").setLevel(logging.WARNING)
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Enable CORS for all routes
 CORS(app)
 
+# Canonical 8-4-4-4-12 UUID text, as sent by clients and stored by PostgreSQL
+UUID_PATTERN = r"[A-Fa-f0-9]{8}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{4}-[A-Fa-f0-9]{12}"
+_UUID_RE = re.compile(UUID_PATTERN)
+
+class RecordIdConverter(BaseConverter):
+    """
+    Integer or UUID primary key for the generic table routes
+    
+    Malformed IDs do not match any route (404) instead of reaching Supabase.
+    """
+    regex = r"\d+|" + UUID_PATTERN
+
+    def to_python(self, value):
+        return int(value) if value.isdigit() else uuid.UUID(value)
+
+    def to_url(self, value):
+        return str(value)
+
+# Tables served by the generic /api/<table_name> endpoints
+ALLOWED_TABLES = frozenset({
+    APPLICANTS_TABLE,
+    CLIENTS_TABLE,
+    RECRUITERS_TABLE,
+    JOB_DESCRIPTIONS_TABLE,
+    APPLICATIONS_TABLE,
+})
+
+class TableConverter(AnyConverter):
+    """
+    Table name for the generic routes, restricted to ALLOWED_TABLES
+    
+    Other names do not match any route (404) instead of costing a Supabase
+    round trip that fails.
+    """
+
+    def __init__(self, map):
+        super().__init__(map, *sorted(ALLOWED_TABLES))
+
+app.url_map.converters['record_id'] = RecordIdConverter
+app.url_map.converters['table'] = TableConverter
+
+# Fixed error responses, encoded once at import time; the endpoints only wrap
+# the bytes in a new Response. Errors with variable messages still use jsonify.
+def _error_body(message):
+    return fast_dumps({"success": False, "error": message}) + b"\n"
+
+_ERR_ENDPOINT_NOT_FOUND = fast_dumps({"error": "Endpoint not found"}) + b"\n"
+_ERR_INTERNAL = fast_dumps({"success": False, "error": "Internal server error"}) + b"\n"
+_ERR_NO_DATA = _error_body("No data provided")
+_ERR_RECORD_NOT_FOUND = _error_body("Record not found")
+_ERR_APPLICANT_NOT_FOUND = _error_body("Applicant not found")
+_ERR_CLIENT_NOT_FOUND = _error_body("Client not found")
+_ERR_RECRUITER_NOT_FOUND = _error_body("Recruiter not found")
+_ERR_JOB_DESCRIPTION_NOT_FOUND = _error_body("Job description not found")
+_ERR_APPLICATION_NOT_FOUND = _error_body("Job application not found")
+_ERR_NAME_REQUIRED = _error_body("Name is required")
+_ERR_STATUS_REQUIRED = _error_body("Status is required")
+_ERR_APPLICANT_ID_REQUIRED = _error_body("applicant_id is required")
+_ERR_JOB_DESCRIPTION_ID_REQUIRED = _error_body("job_description_id is required")
+_ERR_RECRUITER_ID_REQUIRED = _error_body("recruiter_id is required")
+_ERR_RECORDS_REQUIRED = _error_body("A non-empty list of records is required")
+_ERR_RECORD_BODY = _error_body("Request body must be a JSON object or a list of objects")
+_ERR_APPLICATIONS_REQUIRED = _error_body("A non-empty list of applications is required")
+
+def _error(body, status):
+    """Build an error response from one of the precomputed _ERR_* bodies"""
+    return app.response_class(body, status=status, mimetype='application/json')
+
 # Error handler for 404
 @app.errorhandler(404)
 def not_found(error):
-    return jsonify({"error": "Endpoint not found"}), 404
+    return _error(_ERR_ENDPOINT_NOT_FOUND, 404)
 
 # Error handler for 500
 @app.errorhandler(500)
 def internal_error(error):
-    return jsonify({"error": "Internal server error"}), 500
+    return _error(_ERR_INTERNAL, 500)
+
+# The endpoints do not catch exceptions themselves; these handlers turn them
+# into JSON errors. InvalidInput is raised for invalid input (malformed UUIDs,
+# non-numeric parameters) and its message is returned with a 400. Anything
+# else, other ValueErrors included, is logged with its traceback and answered
+# with a generic 500, so database and driver messages are not sent to clients.
+@app.errorhandler(InvalidInput)
+def invalid_input(error):
+    return jsonify({"success": False, "error": str(error)}), 400
+
+# Other HTTP errors (405, 413, ...) keep their status code
+@app.errorhandler(HTTPException)
+def http_error(error):
+    return jsonify({"success": False, "error": error.name}), error.code
+
+@app.errorhandler(Exception)
+def unhandled_error(error):
+    app.logger.exception("Unhandled error in %s %s", request.method, request.path)
+    return _error(_ERR_INTERNAL, 500)
+
+# Row serializers shared by the list, dashboard and export endpoints, generated
+# once per model. IDs are passed through str() on purpose: model IDs are
+# DbUUIDs, whose str() returns the string read from the database, while orjson
+# only encodes exact uuid.UUID natively and would send them through the
+# provider's default() hook; that measured about 2x slower on a 10k-row list.
+# The key order is also the column order of ?format=columnar lists.
+APPLICANT_ENCODERS = make_encoders({
+    "id": str,
+    "name": None,
+    "last_name": None,
+    "linkedin": None,
+    "email": None,
+    "phone": None,
+    "city": None,
+    "english": None,
+    "created_at": None,
+    "deactive_at": None,
+}, attrs={"created_at": "created_at_iso", "deactive_at": "deactive_at_iso"})
+
+CLIENT_ENCODERS = make_encoders({
+    "id": str,
+    "name": None,
+    "description": None,
+    "created_at": None,
+    "deactive": None,
+}, attrs={"created_at": "created_at_iso", "deactive": "deactive_iso"})
+
+RECRUITER_ENCODERS = make_encoders({
+    "id": str,
+    "name": None,
+    "description": None,
+    "created_at": None,
+    "deactive_at": None,
+}, attrs={"created_at": "created_at_iso", "deactive_at": "deactive_at_iso"})
+
+JOB_DESCRIPTION_ENCODERS = make_encoders({
+    "id": str,
+    "title": None,
+    "description": None,
+    "min_salary": None,
+    "max_salary": None,
+    "status": None,
+    "recruiter_id": None,
+    "client_id": str,
+    "created_at": None,
+    "deactive_at": None,
+}, attrs={"created_at": "created_at_iso", "deactive_at": "deactive_at_iso"})
+
+APPLICATION_ENCODERS = make_encoders({
+    "id": None,
+    "applicant_id": str,
+    "job_description_id": str,
+    "recruiter_id": str,
+    "created_at": None,
+    "deactive_at": None,
+}, attrs={"created_at": "created_at_iso", "deactive_at": "deactive_at_iso"})
+
+# The paginated lists of the two largest tables send the database rows as they
+# are: the selected columns are already the API representation (same keys,
+# order and values as the encoders above), so no model objects are built.
+JOB_DESCRIPTION_ROWS = passthrough_encoders(JOB_DESCRIPTION_ROW_COLUMNS.split(","))
+APPLICATION_ROWS = passthrough_encoders(APPLICATION_ROW_COLUMNS.split(","))
+
+def _list_response(items, encoders, page=None):
+    """
+    Build the 200 response of a list endpoint
+    
+    items are serialized with encoders, the model's RowEncoders. With ?format=columnar the rows are sent as arrays under "rows" with the
+    field names once in "columns", which skips building a dict per row and
+    keeps the field names out of every row of large results.
+    
+    page is the (limit, offset) of a paginated list; the response then
+    includes them, plus next_offset when a full page was returned.
+    """
+    if request.args.get('format') == 'columnar':
+        body = {
+            "success": True,
+            "columns": encoders.columns,
+            "rows": encoders.serialize_rows(items),
+            "count": len(items)
+        }
+    else:
+        body = {
+            "success": True,
+            "data": encoders.serialize_many(items),
+            "count": len(items)
+        }
+    if page is not None:
+        limit, offset = page
+        body["limit"] = limit
+        body["offset"] = offset
+        if len(items) == limit:
+            body["next_offset"] = offset + limit
+    return jsonify(body), 200
+
+def _ndjson_response(rows, serialize):
+    """
+    Stream rows as newline-delimited JSON, one serialized object per line
+    
+    rows is an iterator reading Supabase page by page, so the full list is
+    never held in memory. The first row is read before the response starts:
+    errors reading the first page return a JSON 500, later errors end the
+    stream early.
+    """
+    first = next(rows, None)
+    
+    def generate():
+        if first is None:
+            return
+        yield fast_dumps(serialize(first)) + b"\n"
+        for row in rows:
+            yield fast_dumps(serialize(row)) + b"\n"
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+# Page size of the paginated list endpoints (?limit=&offset=)
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+def _page_args():
+    """
+    Read ?limit= and ?offset= for a paginated list
+    
+    Returns:
+        (limit, offset); limit defaults to DEFAULT_PAGE_SIZE and is capped at
+        MAX_PAGE_SIZE
+        
+    Raises:
+        InvalidInput: limit or offset is not a valid number
+    """
+    try:
+        limit = int(request.args.get('limit', DEFAULT_PAGE_SIZE))
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        raise InvalidInput("limit and offset must be integers") from None
+    if limit < 1 or offset < 0:
+        raise InvalidInput("limit must be positive and offset non-negative")
+    return min(limit, MAX_PAGE_SIZE), offset
+
+# Responses smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 1024
+
+# Conditional GET: tag successful reads with a hash of the body so clients can
+# revalidate with If-None-Match and receive a bodiless 304 when nothing changed.
+# Larger bodies are gzipped for clients that accept it; the compressed bytes
+# are cached by that hash, so repeated reads of unchanged data skip compression.
+# Endpoints that know the version of what they return set a weak ETag
+# themselves (see _record_etag); it is kept instead of hashing the body.
+@app.after_request
+def add_etag(response):
+    if request.method != 'GET' or response.status_code != 200 or response.is_streamed:
+        return response
+    body = response.get_data()
+    etag, weak = response.get_etag()
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    if etag is None:
+        etag = digest
+    if len(body) >= GZIP_MIN_SIZE and 'Content-Encoding' not in response.headers:
+        response.vary.add('Accept-Encoding')
+        if request.accept_encodings['gzip']:
+            response.set_data(gzipped(digest, body))
+            response.headers['Content-Encoding'] = 'gzip'
+            # Each encoding of the body needs its own strong ETag
+            if not weak:
+                etag += '-gzip'
+    response.set_etag(etag, weak=weak)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response.make_conditional(request)
+
+def _record_etag(record_id, updated_at):
+    """
+    Weak ETag of a single record from its ID and updated_at column
+    
+    Returns:
+        The tag, or None when the row has no updated_at (the migration adding
+        it is not applied); the body hash of add_etag is used then
+    """
+    if updated_at is None:
+        return None
+    return hashlib.blake2b(f"{record_id}:{updated_at}".encode(), digest_size=8).hexdigest()
+
+def _record_response(etag, serialize, record):
+    """
+    Build the response of a single-record GET
+    
+    When the client's If-None-Match already holds etag, a bodiless 304 is
+    returned without encoding the record.
+    """
+    if etag is not None and request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=True)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    response = jsonify({"success": True, "data": serialize(record)})
+    if etag is not None:
+        response.set_etag(etag, weak=True)
+    return response
 
 # Health check endpoint
 @app.route('/api/health', methods=['GET'])
@@ -92,154 +418,309 @@ def health_check():
         "message": "API is running successfully"
     }), 200
 
+# Dashboard endpoint - active applicants, clients, recruiters and job
+# descriptions in one response
+@app.route('/api/dashboard', methods=['GET'])
+def dashboard():
+    """
+    Get all active applicants, clients, recruiters and job descriptions
+    
+    The four table reads run concurrently, so the response takes as long as
+    the slowest one instead of four sequential round trips.
+    """
+    applicants, clients, recruiters, jobs = run_concurrently(
+        get_all_applicants,
+        get_all_clients,
+        get_all_recruiters,
+        get_all_job_descriptions,
+    )
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "applicants": APPLICANT_ENCODERS.serialize_many(applicants),
+            "clients": CLIENT_ENCODERS.serialize_many(clients),
+            "recruiters": RECRUITER_ENCODERS.serialize_many(recruiters),
+            "job_descriptions": JOB_DESCRIPTION_ENCODERS.serialize_many(jobs),
+        },
+        "count": {
+            "applicants": len(applicants),
+            "clients": len(clients),
+            "recruiters": len(recruiters),
+            "job_descriptions": len(jobs),
+        }
+    }), 200
+
 # Generic GET endpoint - retrieve all records from a table
-@app.route('/api/<table_name>', methods=['GET'])
+@app.route('/api/<table:table_name>', methods=['GET'])
 def get_records(table_name):
     """
     Get all records from a specified table
     
     Query parameters:
         - Any column name can be used as a filter (e.g., ?status=active)
+        - Repeat a parameter to match any of several values (e.g., ?id=1&id=2)
     """
-    try:
-        # Get query parameters for filtering
-        filters = request.args.to_dict()
-        
-        # Query the table
-        data = query_table(table_name, filters if filters else None)
-        
-        return jsonify({
-            "success": True,
-            "data": data,
-            "count": len(data)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    # Get query parameters for filtering; repeated parameters become lists
+    filters = {
+        column: values[0] if len(values) == 1 else values
+        for column, values in request.args.lists()
+    }
+    
+    # Query the table
+    data = query_table(table_name, filters if filters else None)
+    
+    return jsonify({
+        "success": True,
+        "data": data,
+        "count": len(data)
+    }), 200
 
 # Generic GET endpoint - retrieve a single record by ID
-@app.route('/api/<table_name>/<int:record_id>', methods=['GET'])
+@app.route('/api/<table:table_name>/<record_id:record_id>', methods=['GET'])
 def get_record(table_name, record_id):
     """Get a single record by ID from a specified table"""
-    try:
-        data = query_table(table_name, {"id": record_id})
-        
-        if not data:
-            return jsonify({
-                "success": False,
-                "error": "Record not found"
-            }), 404
-        
-        return jsonify({
-            "success": True,
-            "data": data[0]
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    data = get_record_by_id(table_name, record_id)
+    
+    if data is None:
+        return _error(_ERR_RECORD_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": data
+    }), 200
 
 # Generic POST endpoint - create a new record
-@app.route('/api/<table_name>', methods=['POST'])
+@app.route('/api/<table:table_name>', methods=['POST'])
 def create_record(table_name):
     """
     Create a new record in a specified table
     
-    Request body should be JSON with the record data
+    Request body should be JSON with the record data, or a list of records
+    to insert them all in one request (same as /api/<table_name>/bulk)
+    """
+    # The raw body is forwarded to Supabase as is; it is only decoded here
+    # to validate it
+    raw = request.get_data(cache=False)
+    data = _load_json(raw)
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    if isinstance(data, list):
+        return _insert_records(table_name, data, raw)
+    # Anything else (a string, a number) would only fail in PostgREST
+    if not isinstance(data, dict):
+        return _error(_ERR_RECORD_BODY, 400)
+    
+    # Insert the record
+    result = insert_raw(table_name, raw)
+    
+    return jsonify({
+        "success": True,
+        "data": result,
+        "message": "Record created successfully"
+    }), 201
+
+# Generic bulk POST endpoint - create several records in one INSERT
+@app.route('/api/<table:table_name>/bulk', methods=['POST'])
+def create_records_bulk(table_name):
+    """
+    Create several records in a specified table with a single insert
+    
+    Request body should be a JSON list of records; either all of them are
+    inserted or none
     """
+    raw = request.get_data(cache=False)
+    data = _load_json(raw)
+    
+    if not data or not isinstance(data, list):
+        return _error(_ERR_RECORDS_REQUIRED, 400)
+    
+    return _insert_records(table_name, data, raw)
+
+def _load_json(raw):
+    """Decode a request body, returning None when it is empty or not valid JSON"""
     try:
-        # Get JSON data from request
-        data = request.get_json()
-        
-        if not data:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+# Largest request body accepted by the single-record write endpoints; the
+# endpoints taking lists of records accept up to MAX_BULK_BODY_SIZE
+MAX_JSON_BODY_SIZE = 1024 * 1024
+MAX_BULK_BODY_SIZE = 16 * 1024 * 1024
+BULK_ENDPOINTS = frozenset({'create_record', 'create_records_bulk', 'create_applications_bulk_endpoint'})
+
+@app.before_request
+def limit_body_size():
+    """Reject oversized bodies with 413 before they are read"""
+    limit = MAX_BULK_BODY_SIZE if request.endpoint in BULK_ENDPOINTS else MAX_JSON_BODY_SIZE
+    if (request.content_length or 0) > limit:
+        return jsonify({
+            "success": False,
+            "error": f"Request body exceeds {limit} bytes"
+        }), 413
+
+def _json_body():
+    """
+    Decode the JSON object body of a single-record write
+    
+    The body is parsed with orjson straight from the raw bytes, without
+    Flask's get_json() content type check and cached copy. Returns None when
+    the body is empty, not valid JSON or not an object.
+    """
+    data = _load_json(request.get_data(cache=False))
+    return data if isinstance(data, dict) else None
+
+def _validate_uuid(field, value):
+    """
+    Check that a request field holds a UUID string
+    
+    Raises:
+        InvalidInput: value is not a UUID in the canonical 8-4-4-4-12 form
+    """
+    if not isinstance(value, str) or not _UUID_RE.fullmatch(value):
+        raise InvalidInput(f"{field} must be a UUID")
+
+def _parse_uuid(field, value):
+    """Parse a request field holding a UUID string (see _validate_uuid)"""
+    _validate_uuid(field, value)
+    return uuid.UUID(value)
+
+# Keys accepted in a recruiter update body
+RECRUITER_FIELDS = frozenset(RECRUITER_COLUMNS.split(","))
+
+def _validate_recruiter(data, update=False):
+    """
+    Check the fields of a recruiter create or update body
+    
+    Catches bad input before it reaches PostgREST, whose error would be
+    answered with a 500. On update every key is written as a column, so keys
+    that are not recruiter columns are rejected as well.
+    
+    Raises:
+        InvalidInput: name is not a non-empty string, description is not a
+            string or null, or (update) a key is not a recruiter column
+    """
+    if 'name' in data and (not isinstance(data['name'], str) or not data['name']):
+        raise InvalidInput("name must be a non-empty string")
+    description = data.get('description')
+    if description is not None and not isinstance(description, str):
+        raise InvalidInput("description must be a string or null")
+    if update:
+        unknown = data.keys() - RECRUITER_FIELDS
+        if unknown:
+            raise InvalidInput(f"Unknown recruiter fields: {', '.join(sorted(unknown))}")
+
+def _insert_records(table_name, records, raw):
+    """Validate a list of records and insert them (raw body) in one request"""
+    for index, item in enumerate(records):
+        if not isinstance(item, dict) or not item:
             return jsonify({
                 "success": False,
-                "error": "No data provided"
+                "error": f"Item {index}: record must be a non-empty object"
             }), 400
-        
-        # Insert the record
-        result = insert_record(table_name, data)
-        
-        return jsonify({
-            "success": True,
-            "data": result,
-            "message": "Record created successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    
+    # Rows may have different keys; listing every column makes PostgREST
+    # use the column default for keys a row does not have
+    columns = dict.fromkeys(key for item in records for key in item)
+    result = insert_raw(table_name, raw, columns)
+    
+    return jsonify({
+        "success": True,
+        "data": result,
+        "count": len(result),
+        "message": "Records created successfully"
+    }), 201
 
 # Generic PUT endpoint - update a record
-@app.route('/api/<table_name>/<int:record_id>', methods=['PUT'])
+@app.route('/api/<table:table_name>/<record_id:record_id>', methods=['PUT'])
 def update_record_endpoint(table_name, record_id):
     """
     Update a record in a specified table
     
     Request body should be JSON with the fields to update
     """
-    try:
-        # Get JSON data from request
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({
-                "success": False,
-                "error": "No data provided"
-            }), 400
-        
-        # Update the record
-        result = update_record(table_name, record_id, data)
-        
-        if not result:
-            return jsonify({
-                "success": False,
-                "error": "Record not found"
-            }), 404
-        
-        return jsonify({
-            "success": True,
-            "data": result,
-            "message": "Record updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    # Get JSON data from request
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    # Update the record
+    result = update_record(table_name, record_id, data)
+    
+    if not result:
+        return _error(_ERR_RECORD_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": result,
+        "message": "Record updated successfully"
+    }), 200
 
 # Generic DELETE endpoint - delete a record
-@app.route('/api/<table_name>/<int:record_id>', methods=['DELETE'])
+@app.route('/api/<table:table_name>/<record_id:record_id>', methods=['DELETE'])
 def delete_record_endpoint(table_name, record_id):
     """Delete a record from a specified table"""
-    try:
-        # Delete the record
-        result = delete_record(table_name, record_id)
-        
-        if not result:
-            return jsonify({
-                "success": False,
-                "error": "Record not found"
-            }), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Record deleted successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    # Delete the record
+    result = delete_record(table_name, record_id)
+    
+    if not result:
+        return _error(_ERR_RECORD_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Record deleted successfully"
+    }), 200
+
+# ============================
+# STATUS CHANGE ENDPOINTS
+# ============================
+
+# (entity, action) -> (function, not-found error body, success message prefix)
+STATUS_ACTIONS = {
+    ('applicants', 'deactivate'): (deactivate_applicant, _ERR_APPLICANT_NOT_FOUND, "Applicant deactivated"),
+    ('applicants', 'reactivate'): (reactivate_applicant, _ERR_APPLICANT_NOT_FOUND, "Applicant reactivated"),
+    ('clients', 'deactivate'): (deactivate_client, _ERR_CLIENT_NOT_FOUND, "Client deactivated"),
+    ('clients', 'reactivate'): (reactivate_client, _ERR_CLIENT_NOT_FOUND, "Client reactivated"),
+    ('recruiters', 'deactivate'): (deactivate_recruiter, _ERR_RECRUITER_NOT_FOUND, "Recruiter deactivated"),
+    ('recruiters', 'reactivate'): (reactivate_recruiter, _ERR_RECRUITER_NOT_FOUND, "Recruiter reactivated"),
+    ('job-descriptions', 'close'): (close_job_description, _ERR_JOB_DESCRIPTION_NOT_FOUND, "Job description closed"),
+    ('job-descriptions', 'reopen'): (reopen_job_description, _ERR_JOB_DESCRIPTION_NOT_FOUND, "Job description reopened"),
+    ('applicant-job-applications', 'deactivate'): (deactivate_application, _ERR_APPLICATION_NOT_FOUND, "Job application deactivated"),
+    ('applicant-job-applications', 'reactivate'): (reactivate_application, _ERR_APPLICATION_NOT_FOUND, "Job application reactivated"),
+}
+
+@app.route(
+    '/api/<any(applicants, clients, recruiters, "job-descriptions"):entity>/<uuid:record_id>'
+    '/<any(deactivate, reactivate, close, reopen):action>',
+    methods=['POST'],
+)
+@app.route(
+    '/api/<any("applicant-job-applications"):entity>/<int:record_id>'
+    '/<any(deactivate, reactivate):action>',
+    methods=['POST'],
+)
+def change_status_endpoint(entity, record_id, action):
+    """
+    Soft delete / restore a record: deactivate or reactivate an applicant,
+    client, recruiter or job application, close or reopen a job description
+    """
+    if (entity, action) not in STATUS_ACTIONS:
+        return _error(_ERR_ENDPOINT_NOT_FOUND, 404)
+    change_status, not_found_body, done = STATUS_ACTIONS[(entity, action)]
+    updated = change_status(record_id)
+    
+    if not updated:
+        return _error(not_found_body, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": f"{done} successfully"
+    }), 200
+
 
 # ============================
 # APPLICANTS API ENDPOINTS
@@ -248,218 +729,150 @@ def delete_record_endpoint(table_name, record_id):
 @app.route('/api/applicants', methods=['GET'])
 def list_applicants():
     """Get all applicants (active by default)"""
-    try:
-        include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
-        applicants = get_all_applicants(include_inactive=include_inactive)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(a.id),
-                "name": a.name,
-                "last_name": a.last_name,
-                "linkedin": a.linkedin,
-                "email": a.email,
-                "phone": a.phone,
-                "city": a.city,
-                "english": a.english,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-                "deactive_at": a.deactive_at.isoformat() if a.deactive_at else None,
-            } for a in applicants],
-            "count": len(applicants)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    applicants = get_all_applicants(include_inactive=include_inactive)
+    
+    return _list_response(applicants, APPLICANT_ENCODERS)
+
+
+@app.route('/api/applicants.ndjson', methods=['GET'])
+def export_applicants():
+    """Stream all applicants (active by default) as newline-delimited JSON"""
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    return _ndjson_response(iter_all_applicants(include_inactive=include_inactive), APPLICANT_ENCODERS.serialize)
 
 
 @app.route('/api/applicants/search', methods=['GET'])
 def search_applicants_endpoint():
     """Search applicants by name, city, english level, or email"""
-    try:
-        name = request.args.get('name')
-        city = request.args.get('city')
-        english = request.args.get('english')
-        email = request.args.get('email')
-        
-        applicants = search_applicants(
-            name=name,
-            city=city,
-            english_level=english,
-            email=email
-        )
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(a.id),
-                "name": a.name,
-                "last_name": a.last_name,
-                "linkedin": a.linkedin,
-                "email": a.email,
-                "phone": a.phone,
-                "city": a.city,
-                "english": a.english,
-            } for a in applicants],
-            "count": len(applicants)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    name = request.args.get('name')
+    city = request.args.get('city')
+    english = request.args.get('english')
+    email = request.args.get('email')
+    
+    applicants = search_applicants(
+        name=name,
+        city=city,
+        english_level=english,
+        email=email
+    )
+    
+    return jsonify({
+        "success": True,
+        "data": [{
+            "id": str(a.id),
+            "name": a.name,
+            "last_name": a.last_name,
+            "linkedin": a.linkedin,
+            "email": a.email,
+            "phone": a.phone,
+            "city": a.city,
+            "english": a.english,
+        } for a in applicants],
+        "count": len(applicants)
+    }), 200
 
 
-@app.route('/api/applicants/<applicant_id>', methods=['GET'])
+@app.route('/api/applicants/<uuid:applicant_id>', methods=['GET'])
 def get_applicant(applicant_id):
     """Get a single applicant by ID"""
-    try:
-        applicant = get_applicant_by_id(applicant_id)
-        
-        if not applicant:
-            return jsonify({"success": False, "error": "Applicant not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(applicant.id),
-                "name": applicant.name,
-                "last_name": applicant.last_name,
-                "linkedin": applicant.linkedin,
-                "email": applicant.email,
-                "phone": applicant.phone,
-                "city": applicant.city,
-                "english": applicant.english,
-                "created_at": applicant.created_at.isoformat() if applicant.created_at else None,
-                "deactive_at": applicant.deactive_at.isoformat() if applicant.deactive_at else None,
-            }
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    applicant = get_applicant_by_id(applicant_id)
+    
+    if not applicant:
+        return _error(_ERR_APPLICANT_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(applicant.id),
+            "name": applicant.name,
+            "last_name": applicant.last_name,
+            "linkedin": applicant.linkedin,
+            "email": applicant.email,
+            "phone": applicant.phone,
+            "city": applicant.city,
+            "english": applicant.english,
+            "created_at": applicant.created_at_iso,
+            "deactive_at": applicant.deactive_at_iso,
+        }
+    }), 200
 
 
 @app.route('/api/applicants', methods=['POST'])
 def create_applicant_endpoint():
     """Create a new applicant"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        # Required fields
-        required = ['name', 'last_name', 'email', 'phone', 'city', 'english']
-        missing = [f for f in required if f not in data]
-        if missing:
-            return jsonify({"success": False, "error": f"Missing fields: {', '.join(missing)}"}), 400
-        
-        applicant = Applicant(
-            name=data['name'],
-            last_name=data['last_name'],
-            linkedin=data.get('linkedin', ''),
-            email=data['email'],
-            phone=data['phone'],
-            city=data['city'],
-            english=data['english'],
-        )
-        
-        created = create_applicant(applicant)
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(created.id),
-                "name": created.name,
-                "last_name": created.last_name,
-                "email": created.email,
-            },
-            "message": "Applicant created successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/applicants/<applicant_id>', methods=['PUT'])
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    # Required fields
+    required = ['name', 'last_name', 'email', 'phone', 'city', 'english']
+    missing = [f for f in required if f not in data]
+    if missing:
+        return jsonify({"success": False, "error": f"Missing fields: {', '.join(missing)}"}), 400
+    
+    applicant = Applicant(
+        name=data['name'],
+        last_name=data['last_name'],
+        linkedin=data.get('linkedin', ''),
+        email=data['email'],
+        phone=data['phone'],
+        city=data['city'],
+        english=data['english'],
+    )
+    
+    created = create_applicant(applicant)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(created.id),
+            "name": created.name,
+            "last_name": created.last_name,
+            "email": created.email,
+        },
+        "message": "Applicant created successfully"
+    }), 201
+
+
+@app.route('/api/applicants/<uuid:applicant_id>', methods=['PUT'])
 def update_applicant_endpoint(applicant_id):
     """Update an applicant"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        updated = update_applicant(applicant_id, data)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Applicant not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(updated.id),
-                "name": updated.name,
-                "last_name": updated.last_name,
-                "email": updated.email,
-            },
-            "message": "Applicant updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    updated = update_applicant(applicant_id, data)
+    
+    if not updated:
+        return _error(_ERR_APPLICANT_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(updated.id),
+            "name": updated.name,
+            "last_name": updated.last_name,
+            "email": updated.email,
+        },
+        "message": "Applicant updated successfully"
+    }), 200
 
 
-@app.route('/api/applicants/<applicant_id>', methods=['DELETE'])
+@app.route('/api/applicants/<uuid:applicant_id>', methods=['DELETE'])
 def delete_applicant_endpoint(applicant_id):
     """Permanently delete an applicant"""
-    try:
-        success = delete_applicant(applicant_id)
-        
-        if not success:
-            return jsonify({"success": False, "error": "Applicant not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Applicant deleted successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/applicants/<applicant_id>/deactivate', methods=['POST'])
-def deactivate_applicant_endpoint(applicant_id):
-    """Soft delete - deactivate an applicant"""
-    try:
-        updated = deactivate_applicant(applicant_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Applicant not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Applicant deactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/applicants/<applicant_id>/reactivate', methods=['POST'])
-def reactivate_applicant_endpoint(applicant_id):
-    """Reactivate a deactivated applicant"""
-    try:
-        updated = reactivate_applicant(applicant_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Applicant not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Applicant reactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    success = delete_applicant(applicant_id)
+    
+    if not success:
+        return _error(_ERR_APPLICANT_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Applicant deleted successfully"
+    }), 200
 
 
 # ============================
@@ -469,184 +882,114 @@ def reactivate_applicant_endpoint(applicant_id):
 @app.route('/api/clients', methods=['GET'])
 def list_clients():
     """Get all clients (active by default)"""
-    try:
-        include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
-        clients = get_all_clients(include_inactive=include_inactive)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(c.id),
-                "name": c.name,
-                "description": c.description,
-                "created_at": c.created_at.isoformat() if c.created_at else None,
-                "deactive": c.deactive.isoformat() if c.deactive else None,
-            } for c in clients],
-            "count": len(clients)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    clients = get_all_clients(include_inactive=include_inactive)
+    
+    return _list_response(clients, CLIENT_ENCODERS)
 
 
 @app.route('/api/clients/search', methods=['GET'])
 def search_clients_endpoint():
     """Search clients by name or description"""
-    try:
-        name = request.args.get('name')
-        description = request.args.get('description')
-        
-        clients = search_clients(name=name, description=description)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(c.id),
-                "name": c.name,
-                "description": c.description,
-                "created_at": c.created_at.isoformat() if c.created_at else None,
-            } for c in clients],
-            "count": len(clients)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    name = request.args.get('name')
+    description = request.args.get('description')
+    
+    clients = search_clients(name=name, description=description)
+    
+    return jsonify({
+        "success": True,
+        "data": [{
+            "id": str(c.id),
+            "name": c.name,
+            "description": c.description,
+            "created_at": c.created_at_iso,
+        } for c in clients],
+        "count": len(clients)
+    }), 200
 
 
-@app.route('/api/clients/<client_id>', methods=['GET'])
+@app.route('/api/clients/<uuid:client_id>', methods=['GET'])
 def get_client(client_id):
     """Get a single client by ID"""
-    try:
-        client = get_client_by_id(client_id)
-        
-        if not client:
-            return jsonify({"success": False, "error": "Client not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(client.id),
-                "name": client.name,
-                "description": client.description,
-                "created_at": client.created_at.isoformat() if client.created_at else None,
-                "deactive": client.deactive.isoformat() if client.deactive else None,
-            }
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    client = get_client_by_id(client_id)
+    
+    if not client:
+        return _error(_ERR_CLIENT_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(client.id),
+            "name": client.name,
+            "description": client.description,
+            "created_at": client.created_at_iso,
+            "deactive": client.deactive_iso,
+        }
+    }), 200
 
 
 @app.route('/api/clients', methods=['POST'])
 def create_client_endpoint():
     """Create a new client"""
-    try:
-        data = request.get_json()
-        
-        if not data or 'name' not in data:
-            return jsonify({"success": False, "error": "Name is required"}), 400
-        
-        client = Client(
-            name=data['name'],
-            description=data.get('description')
-        )
-        
-        created = create_client(client)
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(created.id),
-                "name": created.name,
-                "description": created.description,
-            },
-            "message": "Client created successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data or 'name' not in data:
+        return _error(_ERR_NAME_REQUIRED, 400)
+    
+    client = Client(
+        name=data['name'],
+        description=data.get('description')
+    )
+    
+    created = create_client(client)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(created.id),
+            "name": created.name,
+            "description": created.description,
+        },
+        "message": "Client created successfully"
+    }), 201
 
 
-@app.route('/api/clients/<client_id>', methods=['PUT'])
+@app.route('/api/clients/<uuid:client_id>', methods=['PUT'])
 def update_client_endpoint(client_id):
     """Update a client"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        updated = update_client(client_id, data)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Client not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(updated.id),
-                "name": updated.name,
-                "description": updated.description,
-            },
-            "message": "Client updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    updated = update_client(client_id, data)
+    
+    if not updated:
+        return _error(_ERR_CLIENT_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(updated.id),
+            "name": updated.name,
+            "description": updated.description,
+        },
+        "message": "Client updated successfully"
+    }), 200
 
 
-@app.route('/api/clients/<client_id>', methods=['DELETE'])
+@app.route('/api/clients/<uuid:client_id>', methods=['DELETE'])
 def delete_client_endpoint(client_id):
     """Permanently delete a client"""
-    try:
-        success = delete_client(client_id)
-        
-        if not success:
-            return jsonify({"success": False, "error": "Client not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Client deleted successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/clients/<client_id>/deactivate', methods=['POST'])
-def deactivate_client_endpoint(client_id):
-    """Soft delete - deactivate a client"""
-    try:
-        updated = deactivate_client(client_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Client not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Client deactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/clients/<client_id>/reactivate', methods=['POST'])
-def reactivate_client_endpoint(client_id):
-    """Reactivate a deactivated client"""
-    try:
-        updated = reactivate_client(client_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Client not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Client reactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    success = delete_client(client_id)
+    
+    if not success:
+        return _error(_ERR_CLIENT_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Client deleted successfully"
+    }), 200
 
 
 # ============================
@@ -655,184 +998,128 @@ def reactivate_client_endpoint(client_id):
 
 @app.route('/api/recruiters', methods=['GET'])
 def list_recruiters():
-    """Get all recruiters (active by default)"""
-    try:
-        include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
-        recruiters = get_all_recruiters(include_inactive=include_inactive)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(r.id),
-                "name": r.name,
-                "description": r.description,
-                "created_at": r.created_at.isoformat() if r.created_at else None,
-                "deactive_at": r.deactive_at.isoformat() if r.deactive_at else None,
-            } for r in recruiters],
-            "count": len(recruiters)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    """
+    Get all recruiters (active by default)
+    
+    Query parameters:
+        - fields: Comma-separated columns to return (e.g. ?fields=id,name);
+          only these are read from Supabase
+    """
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    fields = request.args.get('fields')
+    if fields:
+        columns = list(dict.fromkeys(fields.split(',')))
+        rows = get_recruiter_rows(columns, include_inactive=include_inactive)
+        return _list_response(rows, passthrough_encoders(columns))
+    
+    recruiters = get_all_recruiters(include_inactive=include_inactive)
+    
+    return _list_response(recruiters, RECRUITER_ENCODERS)
 
 
 @app.route('/api/recruiters/search', methods=['GET'])
 def search_recruiters_endpoint():
     """Search recruiters by name or description"""
-    try:
-        name = request.args.get('name')
-        description = request.args.get('description')
-        
-        recruiters = search_recruiters(name=name, description=description)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(r.id),
-                "name": r.name,
-                "description": r.description,
-            } for r in recruiters],
-            "count": len(recruiters)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    name = request.args.get('name')
+    description = request.args.get('description')
+    
+    recruiters = search_recruiters(name=name, description=description)
+    
+    return jsonify({
+        "success": True,
+        "data": [{
+            "id": str(r.id),
+            "name": r.name,
+            "description": r.description,
+        } for r in recruiters],
+        "count": len(recruiters)
+    }), 200
 
 
-@app.route('/api/recruiters/<recruiter_id>', methods=['GET'])
+@app.route('/api/recruiters/<uuid:recruiter_id>', methods=['GET'])
 def get_recruiter(recruiter_id):
     """Get a single recruiter by ID"""
-    try:
-        recruiter = get_recruiter_by_id(recruiter_id)
-        
-        if not recruiter:
-            return jsonify({"success": False, "error": "Recruiter not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(recruiter.id),
-                "name": recruiter.name,
-                "description": recruiter.description,
-                "created_at": recruiter.created_at.isoformat() if recruiter.created_at else None,
-                "deactive_at": recruiter.deactive_at.isoformat() if recruiter.deactive_at else None,
-            }
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    recruiter = get_recruiter_by_id(recruiter_id)
+    
+    if not recruiter:
+        return _error(_ERR_RECRUITER_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(recruiter.id),
+            "name": recruiter.name,
+            "description": recruiter.description,
+            "created_at": recruiter.created_at_iso,
+            "deactive_at": recruiter.deactive_at_iso,
+        }
+    }), 200
 
 
 @app.route('/api/recruiters', methods=['POST'])
 def create_recruiter_endpoint():
     """Create a new recruiter"""
-    try:
-        data = request.get_json()
-        
-        if not data or 'name' not in data:
-            return jsonify({"success": False, "error": "Name is required"}), 400
-        
-        recruiter = Recruiter(
-            name=data['name'],
-            description=data.get('description')
-        )
-        
-        created = create_recruiter(recruiter)
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(created.id),
-                "name": created.name,
-                "description": created.description,
-            },
-            "message": "Recruiter created successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data or 'name' not in data:
+        return _error(_ERR_NAME_REQUIRED, 400)
+    _validate_recruiter(data)
+    
+    recruiter = Recruiter(
+        name=data['name'],
+        description=data.get('description')
+    )
+    
+    created = create_recruiter(recruiter)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(created.id),
+            "name": created.name,
+            "description": created.description,
+        },
+        "message": "Recruiter created successfully"
+    }), 201
 
 
-@app.route('/api/recruiters/<recruiter_id>', methods=['PUT'])
+@app.route('/api/recruiters/<uuid:recruiter_id>', methods=['PUT'])
 def update_recruiter_endpoint(recruiter_id):
     """Update a recruiter"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        updated = update_recruiter(recruiter_id, data)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Recruiter not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(updated.id),
-                "name": updated.name,
-                "description": updated.description,
-            },
-            "message": "Recruiter updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    _validate_recruiter(data, update=True)
+    
+    updated = update_recruiter(recruiter_id, data)
+    
+    if not updated:
+        return _error(_ERR_RECRUITER_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(updated.id),
+            "name": updated.name,
+            "description": updated.description,
+        },
+        "message": "Recruiter updated successfully"
+    }), 200
 
 
-@app.route('/api/recruiters/<recruiter_id>', methods=['DELETE'])
+@app.route('/api/recruiters/<uuid:recruiter_id>', methods=['DELETE'])
 def delete_recruiter_endpoint(recruiter_id):
     """Permanently delete a recruiter"""
-    try:
-        success = delete_recruiter(recruiter_id)
-        
-        if not success:
-            return jsonify({"success": False, "error": "Recruiter not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Recruiter deleted successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/recruiters/<recruiter_id>/deactivate', methods=['POST'])
-def deactivate_recruiter_endpoint(recruiter_id):
-    """Soft delete - deactivate a recruiter"""
-    try:
-        updated = deactivate_recruiter(recruiter_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Recruiter not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Recruiter deactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/recruiters/<recruiter_id>/reactivate', methods=['POST'])
-def reactivate_recruiter_endpoint(recruiter_id):
-    """Reactivate a deactivated recruiter"""
-    try:
-        updated = reactivate_recruiter(recruiter_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Recruiter not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Recruiter reactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    success = delete_recruiter(recruiter_id)
+    
+    if not success:
+        return _error(_ERR_RECRUITER_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Recruiter deleted successfully"
+    }), 200
 
 
 # ============================
@@ -841,257 +1128,207 @@ def reactivate_recruiter_endpoint(recruiter_id):
 
 @app.route('/api/job-descriptions', methods=['GET'])
 def list_job_descriptions():
-    """Get all job descriptions (active by default)"""
-    try:
-        include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
-        jobs = get_all_job_descriptions(include_inactive=include_inactive)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(j.id),
-                "title": j.title,
-                "description": j.description,
-                "min_salary": j.min_salary,
-                "max_salary": j.max_salary,
-                "status": j.status,
-                "recruiter_id": j.recruiter_id,
-                "client_id": str(j.client_id) if j.client_id else None,
-                "created_at": j.created_at.isoformat() if j.created_at else None,
-                "deactive_at": j.deactive_at.isoformat() if j.deactive_at else None,
-            } for j in jobs],
-            "count": len(jobs)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    """
+    Get job descriptions (active by default), one page at a time
+    
+    With REDIS_URL set, the response body is shared between instances through
+    Redis until the next write to the job_description table (at most 60 s).
+    Bodies stored there are built from rows read from Supabase, not from this
+    instance's query cache, which can predate a write made on another instance.
+    """
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    limit, offset = _page_args()
+    
+    cache_key = f"{include_inactive}:{request.args.get('format', '')}:{limit}:{offset}"
+    body, generation = shared_list_get(JOB_DESCRIPTIONS_TABLE, cache_key)
+    if body is not None:
+        return app.response_class(body, mimetype='application/json')
+    
+    rows = get_job_description_rows(
+        include_inactive=include_inactive,
+        limit=limit,
+        offset=offset,
+        use_cache=generation is None,
+    )
+    
+    response, status = _list_response(rows, JOB_DESCRIPTION_ROWS, page=(limit, offset))
+    if generation is not None:
+        shared_list_set(JOB_DESCRIPTIONS_TABLE, cache_key, response.get_data(), generation)
+    return response, status
+
+
+@app.route('/api/job-descriptions.ndjson', methods=['GET'])
+def export_job_descriptions():
+    """Stream all job descriptions (active by default) as newline-delimited JSON"""
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    return _ndjson_response(
+        iter_all_job_descriptions(include_inactive=include_inactive), JOB_DESCRIPTION_ENCODERS.serialize
+    )
 
 
 @app.route('/api/job-descriptions/search', methods=['GET'])
 def search_job_descriptions_endpoint():
     """Search job descriptions by filters"""
-    try:
-        status = request.args.get('status')
-        client_id = request.args.get('client_id')
-        recruiter_id = request.args.get('recruiter_id', type=int)
-        min_salary_min = request.args.get('min_salary_min', type=float)
-        min_salary_max = request.args.get('min_salary_max', type=float)
-        
-        jobs = search_job_descriptions(
-            status=status,
-            client_id=client_id,
-            recruiter_id=recruiter_id,
-            min_salary_min=min_salary_min,
-            min_salary_max=min_salary_max
-        )
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": str(j.id),
-                "title": j.title,
-                "description": j.description,
-                "min_salary": j.min_salary,
-                "max_salary": j.max_salary,
-                "status": j.status,
-                "recruiter_id": j.recruiter_id,
-                "client_id": str(j.client_id) if j.client_id else None,
-            } for j in jobs],
-            "count": len(jobs)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    status = request.args.get('status')
+    client_id = request.args.get('client_id')
+    recruiter_id = request.args.get('recruiter_id', type=int)
+    min_salary_min = request.args.get('min_salary_min', type=float)
+    min_salary_max = request.args.get('min_salary_max', type=float)
+    
+    jobs = search_job_descriptions(
+        status=status,
+        client_id=client_id,
+        recruiter_id=recruiter_id,
+        min_salary_min=min_salary_min,
+        min_salary_max=min_salary_max
+    )
+    
+    return jsonify({
+        "success": True,
+        "data": [{
+            "id": str(j.id),
+            "title": j.title,
+            "description": j.description,
+            "min_salary": j.min_salary,
+            "max_salary": j.max_salary,
+            "status": j.status,
+            "recruiter_id": j.recruiter_id,
+            "client_id": str(j.client_id) if j.client_id else None,
+        } for j in jobs],
+        "count": len(jobs)
+    }), 200
 
 
-@app.route('/api/job-descriptions/<job_id>', methods=['GET'])
+@app.route('/api/job-descriptions/<uuid:job_id>', methods=['GET'])
 def get_job_description(job_id):
-    """Get a single job description by ID"""
-    try:
-        job = get_job_description_by_id(job_id)
-        
-        if not job:
-            return jsonify({"success": False, "error": "Job description not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(job.id),
-                "title": job.title,
-                "description": job.description,
-                "min_salary": job.min_salary,
-                "max_salary": job.max_salary,
-                "status": job.status,
-                "recruiter_id": job.recruiter_id,
-                "client_id": str(job.client_id) if job.client_id else None,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
-                "deactive_at": job.deactive_at.isoformat() if job.deactive_at else None,
-            }
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    """
+    Get a single job description by ID
+    
+    Revalidation with If-None-Match is answered from the cached record and its
+    updated_at, without encoding the response.
+    """
+    job = get_job_description_by_id(job_id)
+    
+    if not job:
+        return _error(_ERR_JOB_DESCRIPTION_NOT_FOUND, 404)
+    
+    etag = _record_etag(job.id, job.updated_at_iso)
+    return _record_response(etag, JOB_DESCRIPTION_ENCODERS.serialize, job)
 
 
 @app.route('/api/job-descriptions', methods=['POST'])
 def create_job_description_endpoint():
     """Create a new job description"""
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    # Required fields
+    required = ['min_salary', 'title']
+    missing = [f for f in required if f not in data]
+    if missing:
+        return jsonify({"success": False, "error": f"Missing fields: {', '.join(missing)}"}), 400
+    
+    # Parse client_id if provided
+    client_id = None
+    if data.get('client_id'):
+        client_id = _parse_uuid('client_id', data['client_id'])
+    
     try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        # Required fields
-        required = ['min_salary', 'title']
-        missing = [f for f in required if f not in data]
-        if missing:
-            return jsonify({"success": False, "error": f"Missing fields: {', '.join(missing)}"}), 400
-        
-        # Parse client_id if provided
-        client_id = None
-        if data.get('client_id'):
-            client_id = uuid.UUID(data['client_id'])
-        
-        job = JobDescription(
-            title=data['title'],
-            description=data.get('description'),
-            min_salary=float(data['min_salary']),
-            max_salary=float(data['max_salary']) if data.get('max_salary') else None,
-            status=data.get('status', 'OPEN'),
-            recruiter_id=data.get('recruiter_id'),
-            client_id=client_id,
-        )
-        
-        created = create_job_description(job)
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(created.id),
-                "title": created.title,
-                "description": created.description,
-                "min_salary": created.min_salary,
-                "max_salary": created.max_salary,
-                "status": created.status,
-            },
-            "message": "Job description created successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/job-descriptions/<job_id>', methods=['PUT'])
+        min_salary = float(data['min_salary'])
+        max_salary = float(data['max_salary']) if data.get('max_salary') else None
+    except (TypeError, ValueError):
+        raise InvalidInput("min_salary and max_salary must be numbers") from None
+    
+    job = JobDescription(
+        title=data['title'],
+        description=data.get('description'),
+        min_salary=min_salary,
+        max_salary=max_salary,
+        status=data.get('status', 'OPEN'),
+        recruiter_id=data.get('recruiter_id'),
+        client_id=client_id,
+    )
+    
+    created = create_job_description(job)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(created.id),
+            "title": created.title,
+            "description": created.description,
+            "min_salary": created.min_salary,
+            "max_salary": created.max_salary,
+            "status": created.status,
+        },
+        "message": "Job description created successfully"
+    }), 201
+
+
+@app.route('/api/job-descriptions/<uuid:job_id>', methods=['PUT'])
 def update_job_description_endpoint(job_id):
     """Update a job description"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        updated = update_job_description(job_id, data)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job description not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(updated.id),
-                "title": updated.title,
-                "description": updated.description,
-                "min_salary": updated.min_salary,
-                "max_salary": updated.max_salary,
-                "status": updated.status,
-            },
-            "message": "Job description updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    updated = update_job_description(job_id, data)
+    
+    if not updated:
+        return _error(_ERR_JOB_DESCRIPTION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(updated.id),
+            "title": updated.title,
+            "description": updated.description,
+            "min_salary": updated.min_salary,
+            "max_salary": updated.max_salary,
+            "status": updated.status,
+        },
+        "message": "Job description updated successfully"
+    }), 200
 
 
-@app.route('/api/job-descriptions/<job_id>', methods=['DELETE'])
+@app.route('/api/job-descriptions/<uuid:job_id>', methods=['DELETE'])
 def delete_job_description_endpoint(job_id):
     """Permanently delete a job description"""
-    try:
-        success = delete_job_description(job_id)
-        
-        if not success:
-            return jsonify({"success": False, "error": "Job description not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Job description deleted successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/job-descriptions/<job_id>/close', methods=['POST'])
-def close_job_description_endpoint(job_id):
-    """Close a job description"""
-    try:
-        updated = close_job_description(job_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job description not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Job description closed successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/job-descriptions/<job_id>/reopen', methods=['POST'])
-def reopen_job_description_endpoint(job_id):
-    """Reopen a closed job description"""
-    try:
-        updated = reopen_job_description(job_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job description not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Job description reopened successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    success = delete_job_description(job_id)
+    
+    if not success:
+        return _error(_ERR_JOB_DESCRIPTION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Job description deleted successfully"
+    }), 200
 
 
-@app.route('/api/job-descriptions/<job_id>/status', methods=['PUT'])
+@app.route('/api/job-descriptions/<uuid:job_id>/status', methods=['PUT'])
 def change_job_status_endpoint(job_id):
     """Change job description status"""
-    try:
-        data = request.get_json()
-        
-        if not data or 'status' not in data:
-            return jsonify({"success": False, "error": "Status is required"}), 400
-        
-        updated = change_job_status(job_id, data['status'])
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job description not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": str(updated.id),
-                "status": updated.status,
-            },
-            "message": "Status updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data or 'status' not in data:
+        return _error(_ERR_STATUS_REQUIRED, 400)
+    
+    updated = change_job_status(job_id, data['status'])
+    
+    if not updated:
+        return _error(_ERR_JOB_DESCRIPTION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": str(updated.id),
+            "status": updated.status,
+        },
+        "message": "Status updated successfully"
+    }), 200
 
 
 # ============================
@@ -1100,262 +1337,224 @@ def change_job_status_endpoint(job_id):
 
 @app.route('/api/applicant-job-applications', methods=['GET'])
 def list_applications():
-    """Get all job applications (active by default)"""
-    try:
-        include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
-        applications = get_all_applications(include_inactive=include_inactive)
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": a.id,
-                "applicant_id": str(a.applicant_id),
-                "job_description_id": str(a.job_description_id),
-                "recruiter_id": str(a.recruiter_id) if a.recruiter_id else None,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-                "deactive_at": a.deactive_at.isoformat() if a.deactive_at else None,
-            } for a in applications],
-            "count": len(applications)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    """Get job applications (active by default), one page at a time"""
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    limit, offset = _page_args()
+    rows = get_application_rows(include_inactive=include_inactive, limit=limit, offset=offset)
+    
+    return _list_response(rows, APPLICATION_ROWS, page=(limit, offset))
+
+
+@app.route('/api/applicant-job-applications.ndjson', methods=['GET'])
+def export_applications():
+    """Stream all job applications (active by default) as newline-delimited JSON"""
+    include_inactive = request.args.get('include_inactive', 'false').lower() == 'true'
+    return _ndjson_response(
+        iter_all_applications(include_inactive=include_inactive), APPLICATION_ENCODERS.serialize
+    )
 
 
 @app.route('/api/applicant-job-applications/search', methods=['GET'])
 def search_applications_endpoint():
     """Search job applications by filters"""
-    try:
-        applicant_id = request.args.get('applicant_id')
-        job_description_id = request.args.get('job_description_id')
-        recruiter_id = request.args.get('recruiter_id')
-        
-        applications = search_applications(
-            applicant_id=applicant_id,
-            job_description_id=job_description_id,
-            recruiter_id=recruiter_id
-        )
-        
-        return jsonify({
-            "success": True,
-            "data": [{
-                "id": a.id,
-                "applicant_id": str(a.applicant_id),
-                "job_description_id": str(a.job_description_id),
-                "recruiter_id": str(a.recruiter_id) if a.recruiter_id else None,
-                "created_at": a.created_at.isoformat() if a.created_at else None,
-            } for a in applications],
-            "count": len(applications)
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    applicant_id = request.args.get('applicant_id')
+    job_description_id = request.args.get('job_description_id')
+    recruiter_id = request.args.get('recruiter_id')
+    
+    applications = search_applications(
+        applicant_id=applicant_id,
+        job_description_id=job_description_id,
+        recruiter_id=recruiter_id
+    )
+    
+    return jsonify({
+        "success": True,
+        "data": [{
+            "id": a.id,
+            "applicant_id": str(a.applicant_id),
+            "job_description_id": str(a.job_description_id),
+            "recruiter_id": str(a.recruiter_id) if a.recruiter_id else None,
+            "created_at": a.created_at_iso,
+        } for a in applications],
+        "count": len(applications)
+    }), 200
 
 
 @app.route('/api/applicant-job-applications/<int:application_id>', methods=['GET'])
 def get_application(application_id):
     """Get a single job application by ID"""
-    try:
-        application = get_application_by_id(application_id)
-        
-        if not application:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": application.id,
-                "applicant_id": str(application.applicant_id),
-                "job_description_id": str(application.job_description_id),
-                "recruiter_id": str(application.recruiter_id) if application.recruiter_id else None,
-                "created_at": application.created_at.isoformat() if application.created_at else None,
-                "deactive_at": application.deactive_at.isoformat() if application.deactive_at else None,
-            }
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    application = get_application_by_id(application_id)
+    
+    if not application:
+        return _error(_ERR_APPLICATION_NOT_FOUND, 404)
+    
+    etag = _record_etag(application.id, application.updated_at_iso)
+    return _record_response(etag, APPLICATION_ENCODERS.serialize, application)
 
 
 @app.route('/api/applicant-job-applications', methods=['POST'])
 def create_application_endpoint():
     """Create a new job application"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        # Required fields
-        if 'applicant_id' not in data:
-            return jsonify({"success": False, "error": "applicant_id is required"}), 400
-        if 'job_description_id' not in data:
-            return jsonify({"success": False, "error": "job_description_id is required"}), 400
-        
-        # Parse UUIDs
-        applicant_id = uuid.UUID(data['applicant_id'])
-        job_description_id = uuid.UUID(data['job_description_id'])
-        recruiter_id = uuid.UUID(data['recruiter_id']) if data.get('recruiter_id') else None
-        
-        application = ApplicantJobApply(
-            applicant_id=applicant_id,
-            job_description_id=job_description_id,
-            recruiter_id=recruiter_id,
-        )
-        
-        created = create_application(application)
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": created.id,
-                "applicant_id": str(created.applicant_id),
-                "job_description_id": str(created.job_description_id),
-                "recruiter_id": str(created.recruiter_id) if created.recruiter_id else None,
-                "created_at": created.created_at.isoformat() if created.created_at else None,
-            },
-            "message": "Job application created successfully"
-        }), 201
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    # Required fields
+    if 'applicant_id' not in data:
+        return _error(_ERR_APPLICANT_ID_REQUIRED, 400)
+    if 'job_description_id' not in data:
+        return _error(_ERR_JOB_DESCRIPTION_ID_REQUIRED, 400)
+    
+    # Parse UUIDs
+    applicant_id = _parse_uuid('applicant_id', data['applicant_id'])
+    job_description_id = _parse_uuid('job_description_id', data['job_description_id'])
+    recruiter_id = _parse_uuid('recruiter_id', data['recruiter_id']) if data.get('recruiter_id') else None
+    
+    application = ApplicantJobApply(
+        applicant_id=applicant_id,
+        job_description_id=job_description_id,
+        recruiter_id=recruiter_id,
+    )
+    
+    created = create_application(application)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": created.id,
+            "applicant_id": str(created.applicant_id),
+            "job_description_id": str(created.job_description_id),
+            "recruiter_id": str(created.recruiter_id) if created.recruiter_id else None,
+            "created_at": created.created_at_iso,
+        },
+        "message": "Job application created successfully"
+    }), 201
+
+
+@app.route('/api/applicant-job-applications/bulk', methods=['POST'])
+def create_applications_bulk_endpoint():
+    """Create several job applications in one request"""
+    raw = request.get_data(cache=False)
+    data = _load_json(raw)
+    
+    if not data or not isinstance(data, list):
+        return _error(_ERR_APPLICATIONS_REQUIRED, 400)
+    
+    applications = []
+    for index, item in enumerate(data):
+        if not isinstance(item, dict) or 'applicant_id' not in item or 'job_description_id' not in item:
+            return jsonify({
+                "success": False,
+                "error": f"Item {index}: applicant_id and job_description_id are required"
+            }), 400
+        applications.append(ApplicantJobApply(
+            applicant_id=_parse_uuid(f"Item {index}: applicant_id", item['applicant_id']),
+            job_description_id=_parse_uuid(f"Item {index}: job_description_id", item['job_description_id']),
+            recruiter_id=(
+                _parse_uuid(f"Item {index}: recruiter_id", item['recruiter_id'])
+                if item.get('recruiter_id') else None
+            ),
+        ))
+    
+    created = create_applications(applications)
+    
+    return jsonify({
+        "success": True,
+        "data": [{
+            "id": a.id,
+            "applicant_id": str(a.applicant_id),
+            "job_description_id": str(a.job_description_id),
+            "recruiter_id": str(a.recruiter_id) if a.recruiter_id else None,
+            "created_at": a.created_at_iso,
+        } for a in created],
+        "count": len(created),
+        "message": "Job applications created successfully"
+    }), 201
 
 
 @app.route('/api/applicant-job-applications/<int:application_id>', methods=['PUT'])
 def update_application_endpoint(application_id):
     """Update a job application"""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        # Convert UUID strings to UUID objects if present
-        updates = data.copy()
-        if 'applicant_id' in updates:
-            updates['applicant_id'] = str(uuid.UUID(updates['applicant_id']))
-        if 'job_description_id' in updates:
-            updates['job_description_id'] = str(uuid.UUID(updates['job_description_id']))
-        if 'recruiter_id' in updates and updates['recruiter_id']:
-            updates['recruiter_id'] = str(uuid.UUID(updates['recruiter_id']))
-        
-        updated = update_application(application_id, updates)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": updated.id,
-                "applicant_id": str(updated.applicant_id),
-                "job_description_id": str(updated.job_description_id),
-                "recruiter_id": str(updated.recruiter_id) if updated.recruiter_id else None,
-            },
-            "message": "Job application updated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data:
+        return _error(_ERR_NO_DATA, 400)
+    
+    # The body was decoded for this request only, so the IDs are checked in
+    # place and sent as given instead of parsed and re-formatted
+    for field in ('applicant_id', 'job_description_id'):
+        if field in data:
+            _validate_uuid(field, data[field])
+    if data.get('recruiter_id'):
+        _validate_uuid('recruiter_id', data['recruiter_id'])
+    
+    updated = update_application(application_id, data)
+    
+    if not updated:
+        return _error(_ERR_APPLICATION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": updated.id,
+            "applicant_id": str(updated.applicant_id),
+            "job_description_id": str(updated.job_description_id),
+            "recruiter_id": str(updated.recruiter_id) if updated.recruiter_id else None,
+        },
+        "message": "Job application updated successfully"
+    }), 200
 
 
 @app.route('/api/applicant-job-applications/<int:application_id>', methods=['DELETE'])
 def delete_application_endpoint(application_id):
     """Permanently delete a job application"""
-    try:
-        success = delete_application(application_id)
-        
-        if not success:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Job application deleted successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/applicant-job-applications/<int:application_id>/deactivate', methods=['POST'])
-def deactivate_application_endpoint(application_id):
-    """Soft delete - deactivate/withdraw a job application"""
-    try:
-        updated = deactivate_application(application_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Job application deactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/applicant-job-applications/<int:application_id>/reactivate', methods=['POST'])
-def reactivate_application_endpoint(application_id):
-    """Reactivate a deactivated job application"""
-    try:
-        updated = reactivate_application(application_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Job application reactivated successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    success = delete_application(application_id)
+    
+    if not success:
+        return _error(_ERR_APPLICATION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Job application deleted successfully"
+    }), 200
 
 
 @app.route('/api/applicant-job-applications/<int:application_id>/assign-recruiter', methods=['POST'])
 def assign_recruiter_endpoint(application_id):
     """Assign a recruiter to a job application"""
-    try:
-        data = request.get_json()
-        
-        if not data or 'recruiter_id' not in data:
-            return jsonify({"success": False, "error": "recruiter_id is required"}), 400
-        
-        updated = assign_recruiter(application_id, data['recruiter_id'])
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "data": {
-                "id": updated.id,
-                "recruiter_id": str(updated.recruiter_id) if updated.recruiter_id else None,
-            },
-            "message": "Recruiter assigned successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    data = _json_body()
+    
+    if not data or 'recruiter_id' not in data:
+        return _error(_ERR_RECRUITER_ID_REQUIRED, 400)
+    
+    updated = assign_recruiter(application_id, data['recruiter_id'])
+    
+    if not updated:
+        return _error(_ERR_APPLICATION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "data": {
+            "id": updated.id,
+            "recruiter_id": str(updated.recruiter_id) if updated.recruiter_id else None,
+        },
+        "message": "Recruiter assigned successfully"
+    }), 200
 
 
 @app.route('/api/applicant-job-applications/<int:application_id>/unassign-recruiter', methods=['POST'])
 def unassign_recruiter_endpoint(application_id):
     """Remove recruiter assignment from a job application"""
-    try:
-        updated = unassign_recruiter(application_id)
-        
-        if not updated:
-            return jsonify({"success": False, "error": "Job application not found"}), 404
-        
-        return jsonify({
-            "success": True,
-            "message": "Recruiter unassigned successfully"
-        }), 200
-        
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
+    updated = unassign_recruiter(application_id)
+    
+    if not updated:
+        return _error(_ERR_APPLICATION_NOT_FOUND, 404)
+    
+    return jsonify({
+        "success": True,
+        "message": "Recruiter unassigned successfully"
+    }), 200
 
 
 # For local development
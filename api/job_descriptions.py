@@ -3,14 +3,19 @@ Job Descriptions module - CRUD operations for the job_description table
 """
 import uuid
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 from dataclasses import dataclass
+
+from .cache import cached_record, record_cache, shared_record
 from .database import (
     query_table,
+    iter_table,
+    get_record_by_id,
     insert_record,
     update_record,
     delete_record,
 )
+from .utils import fast_uuid, make_decoders, now_iso, parse_timestamp
 
 
 @dataclass
@@ -24,8 +29,21 @@ class JobDescription:
     recruiter_id: Optional[int] = None
     client_id: Optional[uuid.UUID] = None
     id: Optional[uuid.UUID] = None
-    created_at: Optional[datetime] = None
-    deactive_at: Optional[datetime] = None
+    # Raw timestamp strings; parsed only when created_at/deactive_at is accessed
+    created_at_iso: Optional[str] = None
+    deactive_at_iso: Optional[str] = None
+    # Last-modified time, used as the record version for ETags
+    updated_at_iso: Optional[str] = None
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation time of the job description"""
+        return parse_timestamp(self.created_at_iso)
+
+    @property
+    def deactive_at(self) -> Optional[datetime]:
+        """Deactivation time of the job description, None while active"""
+        return parse_timestamp(self.deactive_at_iso)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert job description to dictionary"""
@@ -44,60 +62,138 @@ class JobDescription:
             data["client_id"] = str(self.client_id)
         return data
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "JobDescription":
-        """Create JobDescription from dictionary"""
-        return cls(
-            id=uuid.UUID(data["id"]) if data.get("id") else None,
-            min_salary=data.get("min_salary", 0.0),
-            title=data.get("title", ""),
-            max_salary=data.get("max_salary"),
-            description=data.get("description"),
-            status=data.get("status", "OPEN"),
-            recruiter_id=data.get("recruiter_id"),
-            client_id=uuid.UUID(data["client_id"]) if data.get("client_id") else None,
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            deactive_at=datetime.fromisoformat(data["deactive_at"]) if data.get("deactive_at") else None,
-        )
+
+_from_dict, _from_rows = make_decoders(JobDescription, {
+    "id": fast_uuid,
+    "min_salary": None,
+    "title": None,
+    "max_salary": None,
+    "description": None,
+    "status": None,
+    "recruiter_id": None,
+    "client_id": fast_uuid,
+    "created_at_iso": None,
+    "deactive_at_iso": None,
+    "updated_at_iso": None,
+},
+    columns={
+        "created_at_iso": "created_at",
+        "deactive_at_iso": "deactive_at",
+        "updated_at_iso": "updated_at",
+    })
+JobDescription.from_dict = staticmethod(_from_dict)
+JobDescription.from_rows = staticmethod(_from_rows)
 
 
 # Table name constant
 TABLE_NAME = "job_description"
 
+# Columns of the API representation, in response order; get_job_description_rows
+# selects only these
+COLUMNS = "id,title,description,min_salary,max_salary,status,recruiter_id,client_id,created_at,deactive_at"
+
+# Single-record lookups, invalidated by update_record/delete_record
+_by_id_cache = record_cache(TABLE_NAME)
 
-def get_all_job_descriptions(include_inactive: bool = False) -> List[JobDescription]:
+
+def get_all_job_descriptions(
+    include_inactive: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+) -> List[JobDescription]:
     """
     Get all job descriptions
     
     Args:
         include_inactive: If True, includes deactivated/closed positions
+        limit: Maximum number of job descriptions to return, ordered by ID
+            (optional, all by default)
+        offset: Job descriptions to skip when limit is given (default: 0)
         
     Returns:
         List of JobDescription objects
     """
-    if include_inactive:
-        data = query_table(TABLE_NAME)
+    # Only active positions (deactive_at is NULL) unless include_inactive
+    filters = None if include_inactive else {"deactive_at": None}
+    if limit is None:
+        data = query_table(TABLE_NAME, filters)
     else:
-        # Only active positions (deactive_at is NULL)
-        data = query_table(TABLE_NAME, {"deactive_at": None})
+        data = query_table(TABLE_NAME, filters, limit=limit, offset=offset, order_by="id")
     
-    return [JobDescription.from_dict(record) for record in data]
+    return JobDescription.from_rows(data)
+
 
+def get_job_description_rows(
+    include_inactive: bool = False,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    use_cache: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Get job descriptions as raw rows with the COLUMNS columns
+    
+    For read-only list responses: the rows are returned as decoded from
+    Supabase, without building JobDescription objects. They may be shared
+    with the query cache and must not be modified.
+    
+    Args:
+        include_inactive: If True, includes deactivated/closed positions
+        limit: Maximum number of rows to return, ordered by ID
+            (optional, all by default)
+        offset: Rows to skip when limit is given (default: 0)
+        use_cache: False to bypass the in-process query cache (see query_table)
+        
+    Returns:
+        List of row dictionaries
+    """
+    filters = None if include_inactive else {"deactive_at": None}
+    if limit is None:
+        return query_table(TABLE_NAME, filters, select=COLUMNS, use_cache=use_cache)
+    return query_table(
+        TABLE_NAME, filters, select=COLUMNS, limit=limit, offset=offset, order_by="id",
+        use_cache=use_cache,
+    )
 
+
+def iter_all_job_descriptions(
+    include_inactive: bool = False,
+    page_size: int = 1000,
+) -> Iterator[JobDescription]:
+    """
+    Iterate over all job descriptions without loading them all at once
+    
+    Rows are fetched page by page and decoded one at a time, for exports and
+    other single-pass consumers of large result sets.
+    
+    Args:
+        include_inactive: If True, includes deactivated/closed positions
+        page_size: Rows fetched per request
+        
+    Yields:
+        JobDescription objects ordered by ID
+    """
+    filters = None if include_inactive else {"deactive_at": None}
+    for record in iter_table(TABLE_NAME, filters, page_size=page_size):
+        yield JobDescription.from_dict(record)
+
+
+@cached_record(TABLE_NAME, _by_id_cache)
 def get_job_description_by_id(job_id: str) -> Optional[JobDescription]:
     """
     Get a single job description by ID
     
+    Results are cached for 30 seconds in memory and, when Redis is configured,
+    for 5 minutes in Redis; writes through update_record and delete_record
+    evict both entries.
+    
     Args:
         job_id: UUID of the job description
         
     Returns:
         JobDescription object or None if not found
     """
-    data = query_table(TABLE_NAME, {"id": job_id})
-    if data:
-        return JobDescription.from_dict(data[0])
-    return None
+    record = shared_record(TABLE_NAME, job_id, lambda: get_record_by_id(TABLE_NAME, job_id))
+    return JobDescription.from_dict(record) if record else None
 
 
 def search_job_descriptions(
@@ -120,7 +216,7 @@ def search_job_descriptions(
     Returns:
         List of matching JobDescription objects
     """
-    filters = {}
+    filters = {"deactive_at": None}
     if status:
         filters["status"] = status
     if client_id:
@@ -128,22 +224,19 @@ def search_job_descriptions(
     if recruiter_id is not None:
         filters["recruiter_id"] = recruiter_id
     
-    # Get filtered results or all active if no filters
-    if filters:
-        filters["deactive_at"] = None
-        data = query_table(TABLE_NAME, filters)
-    else:
-        data = query_table(TABLE_NAME, {"deactive_at": None})
-    
-    jobs = [JobDescription.from_dict(record) for record in data]
-    
-    # Apply salary range filtering in Python
+    # Salary bounds are applied by PostgreSQL
+    salary_range = []
     if min_salary_min is not None:
-        jobs = [j for j in jobs if j.min_salary >= min_salary_min]
+        salary_range.append(("gte", min_salary_min))
     if min_salary_max is not None:
-        jobs = [j for j in jobs if j.min_salary <= min_salary_max]
+        salary_range.append(("lte", min_salary_max))
     
-    return jobs
+    data = query_table(
+        TABLE_NAME,
+        filters,
+        range_filters={"min_salary": salary_range} if salary_range else None,
+    )
+    return JobDescription.from_rows(data)
 
 
 def create_job_description(job: JobDescription) -> JobDescription:
@@ -207,7 +300,7 @@ def close_job_description(job_id: str) -> Optional[JobDescription]:
         Updated JobDescription or None if not found
     """
     updates = {
-        "deactive_at": datetime.utcnow().isoformat(),
+        "deactive_at": now_iso(),
         "status": "CLOSED"
     }
     return update_job_description(job_id, updates)
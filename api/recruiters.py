@@ -1,26 +1,46 @@
 """
 Recruiters module - CRUD operations for the recruiter table
 """
-import uuid
+import re
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from functools import partial
+from typing import Optional, Dict, Any, List, Sequence
 from dataclasses import dataclass
+
+from cachetools import cached
+
+from .cache import cached_record, list_cache, lock as cache_lock, record_cache
 from .database import (
     query_table,
+    run_concurrently,
+    get_record_by_id,
     insert_record,
     update_record,
     delete_record,
+    call_function,
 )
+from .utils import InvalidInput, contains_pattern, fast_uuid, make_decoders, now_iso, parse_timestamp
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class Recruiter:
     """Recruiter data model"""
     name: str
     description: Optional[str] = None
     id: Optional[Any] = None
-    created_at: Optional[datetime] = None
-    deactive_at: Optional[datetime] = None
+    # Raw timestamp strings; parsed only when created_at/deactive_at is accessed
+    created_at_iso: Optional[str] = None
+    deactive_at_iso: Optional[str] = None
+
+    @property
+    def created_at(self) -> Optional[datetime]:
+        """Creation time of the recruiter"""
+        return parse_timestamp(self.created_at_iso)
+
+    @property
+    def deactive_at(self) -> Optional[datetime]:
+        """Deactivation time of the recruiter, None while active"""
+        return parse_timestamp(self.deactive_at_iso)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert recruiter to dictionary"""
@@ -31,36 +51,72 @@ class Recruiter:
             data["description"] = self.description
         return data
 
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Recruiter":
-        """Create Recruiter from dictionary"""
-        # Handle both integer IDs and UUIDs
-        id_val = data.get("id")
-        if id_val is not None:
-            if isinstance(id_val, str):
-                try:
-                    id_val = uuid.UUID(id_val)
-                except ValueError:
-                    pass  # Keep as string if not valid UUID
-            # If it's already an int, keep it as is
-        
-        return cls(
-            id=id_val,
-            name=data["name"],
-            description=data.get("description"),
-            created_at=datetime.fromisoformat(data["created_at"]) if data.get("created_at") else None,
-            deactive_at=datetime.fromisoformat(data["deactive_at"]) if data.get("deactive_at") else None,
-        )
+
+# Canonical 8-4-4-4-12 UUID text, the form PostgreSQL returns UUIDs in
+_UUID_RE = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+
+def _parse_id(value: Any) -> Any:
+    """
+    Recruiter ID column value: UUID strings become UUIDs, anything else is kept
+
+    Strings are checked against the UUID layout instead of being tried with
+    uuid.UUID() and its exception. Other values, including malformed
+    36-character strings, are kept as they are: a DbUUID built from them
+    would only fail later, when compared or hashed. fast_uuid defers parsing
+    the value until it is compared.
+    """
+    if isinstance(value, str) and _UUID_RE.fullmatch(value):
+        return fast_uuid(value)
+    return value
+
+
+_from_dict, _from_rows = make_decoders(Recruiter, {
+    "id": _parse_id,
+    "name": None,
+    "description": None,
+    "created_at_iso": None,
+    "deactive_at_iso": None,
+},
+    required=("name",),
+    columns={"created_at_iso": "created_at", "deactive_at_iso": "deactive_at"})
+Recruiter.from_dict = staticmethod(_from_dict)
+Recruiter.from_rows = staticmethod(_from_rows)
 
 
 # Table name constant
 TABLE_NAME = "recruiter"
 
+# Columns read by Recruiter.from_dict; list queries request only these
+COLUMNS = "id,name,description,created_at,deactive_at"
+_COLUMN_SET = frozenset(COLUMNS.split(","))
+
+# Single-record lookups, invalidated by update_record/delete_record. The
+# recruiter table is small and rarely written, so entries are kept longer than
+# the other tables' records.
+_by_id_cache = record_cache(TABLE_NAME, maxsize=1024, ttl=60)
 
+# Decoded get_all_recruiters results, cleared on any write to the table. The
+# active list is read by most admin pages (and the dashboard) and rarely changes.
+_all_cache = list_cache(TABLE_NAME, maxsize=4, ttl=30)
+
+# Rows per request of create_recruiters/update_recruiters; longer lists are
+# sent in several requests to stay under the request size limit of PostgREST
+BULK_BATCH_SIZE = 500
+
+# IDs per request of get_recruiters_by_ids; the IN filter is sent in the URL,
+# and 200 UUIDs keep it well under the usual 8 KB request line limit
+IDS_BATCH_SIZE = 200
+
+
+@cached(cache=_all_cache, lock=cache_lock)
 def get_all_recruiters(include_inactive: bool = False) -> List[Recruiter]:
     """
     Get all recruiters
     
+    Results are cached for 30 seconds and cleared by any write to the table;
+    the returned list is shared and must not be modified.
+    
     Args:
         include_inactive: If True, includes deactivated recruiters
         
@@ -68,28 +124,88 @@ def get_all_recruiters(include_inactive: bool = False) -> List[Recruiter]:
         List of Recruiter objects
     """
     if include_inactive:
-        data = query_table(TABLE_NAME)
+        data = query_table(TABLE_NAME, select=COLUMNS)
     else:
         # Only active recruiters (deactive_at is NULL)
-        data = query_table(TABLE_NAME, {"deactive_at": None})
+        data = query_table(TABLE_NAME, {"deactive_at": None}, select=COLUMNS)
     
-    return [Recruiter.from_dict(record) for record in data]
+    return Recruiter.from_rows(data)
 
 
+def get_recruiter_rows(fields: List[str], include_inactive: bool = False) -> List[Dict[str, Any]]:
+    """
+    Get recruiters as raw rows with only some of the COLUMNS columns
+    
+    For list views that only show e.g. id and name: the other columns
+    (description can be long) are neither sent by Supabase nor decoded. The
+    rows may be shared with the query cache and must not be modified.
+    
+    Args:
+        fields: Columns to select, in the order wanted
+        include_inactive: If True, includes deactivated recruiters
+        
+    Returns:
+        List of row dictionaries with the fields as keys
+        
+    Raises:
+        InvalidInput: a field is not one of COLUMNS
+    """
+    unknown = [field for field in fields if field not in _COLUMN_SET]
+    if unknown or not fields:
+        raise InvalidInput(f"fields must be a comma-separated subset of: {COLUMNS}")
+    filters = None if include_inactive else {"deactive_at": None}
+    return query_table(TABLE_NAME, filters, select=",".join(fields))
+
+
+@cached_record(TABLE_NAME, _by_id_cache)
 def get_recruiter_by_id(recruiter_id: str) -> Optional[Recruiter]:
     """
     Get a single recruiter by ID
     
+    Results are cached for 60 seconds; writes through update_record and
+    delete_record (including deactivate/reactivate) evict the entry. A
+    recruiter that was not found is not cached.
+    
     Args:
         recruiter_id: UUID of the recruiter
         
     Returns:
         Recruiter object or None if not found
     """
-    data = query_table(TABLE_NAME, {"id": recruiter_id})
-    if data:
-        return Recruiter.from_dict(data[0])
-    return None
+    record = get_record_by_id(TABLE_NAME, recruiter_id)
+    return Recruiter.from_dict(record) if record else None
+
+
+def get_recruiters_by_ids(ids: Sequence[str]) -> Dict[str, Recruiter]:
+    """
+    Get several recruiters by ID with one request per IDS_BATCH_SIZE IDs
+    
+    For pages listing records that reference recruiters (e.g. job
+    descriptions): one IN query instead of a get_recruiter_by_id call per
+    row. Batches are requested concurrently.
+    
+    Args:
+        ids: UUIDs of the recruiters; duplicates are requested once
+        
+    Returns:
+        Dictionary of Recruiter objects keyed by their ID as a string; IDs
+        that do not exist are missing from it
+    """
+    unique_ids = list(dict.fromkeys(str(recruiter_id) for recruiter_id in ids))
+    batches = run_concurrently(*(
+        partial(
+            query_table,
+            TABLE_NAME,
+            {"id": unique_ids[start:start + IDS_BATCH_SIZE]},
+            select=COLUMNS,
+        )
+        for start in range(0, len(unique_ids), IDS_BATCH_SIZE)
+    ))
+    return {
+        str(recruiter.id): recruiter
+        for rows in batches
+        for recruiter in Recruiter.from_rows(rows)
+    }
 
 
 def search_recruiters(
@@ -99,6 +215,9 @@ def search_recruiters(
     """
     Search recruiters by name or description
     
+    Without a filter this is get_all_recruiters() and returns its cached list,
+    which must not be modified.
+    
     Args:
         name: Filter by name (partial match)
         description: Filter by description (partial match)
@@ -106,26 +225,18 @@ def search_recruiters(
     Returns:
         List of matching Recruiter objects
     """
-    # Get all active recruiters first
-    data = query_table(TABLE_NAME, {"deactive_at": None})
-    recruiters = [Recruiter.from_dict(record) for record in data]
+    if not name and not description:
+        return get_all_recruiters()
     
-    # Apply partial match filtering in Python
+    # Partial matches run in PostgreSQL (ILIKE), so only matching rows come back
+    ilike_filters = {}
     if name:
-        name_lower = name.lower()
-        recruiters = [
-            r for r in recruiters 
-            if name_lower in r.name.lower()
-        ]
-    
+        ilike_filters["name"] = contains_pattern(name)
     if description:
-        desc_lower = description.lower()
-        recruiters = [
-            r for r in recruiters 
-            if r.description and desc_lower in r.description.lower()
-        ]
+        ilike_filters["description"] = contains_pattern(description)
     
-    return recruiters
+    data = query_table(TABLE_NAME, {"deactive_at": None}, select=COLUMNS, ilike_filters=ilike_filters)
+    return Recruiter.from_rows(data)
 
 
 def create_recruiter(recruiter: Recruiter) -> Recruiter:
@@ -146,6 +257,92 @@ def create_recruiter(recruiter: Recruiter) -> Recruiter:
     raise Exception("Failed to create recruiter")
 
 
+def create_recruiters(recruiters: List[Recruiter]) -> List[Recruiter]:
+    """
+    Create several recruiters with one INSERT per BULK_BATCH_SIZE rows
+    
+    Each batch is inserted all or nothing; if a batch fails, the batches
+    before it stay inserted.
+    
+    Args:
+        recruiters: Recruiter objects to create
+        
+    Returns:
+        Created Recruiters with IDs and timestamps, in the same order
+    """
+    created = []
+    for start in range(0, len(recruiters), BULK_BATCH_SIZE):
+        batch = recruiters[start:start + BULK_BATCH_SIZE]
+        # Same keys in every row (unlike to_dict, which omits a missing
+        # description), so the rows are built without branching
+        rows = [{"name": r.name, "description": r.description} for r in batch]
+        result = insert_record(TABLE_NAME, rows)
+        if not result or len(result) != len(batch):
+            raise Exception("Failed to create recruiters")
+        created.extend(Recruiter.from_rows(result))
+    return created
+
+
+def _existing_ids(ids: List[str]) -> set:
+    """IDs among ids that exist, read from the database (not the query cache)"""
+    batches = run_concurrently(*(
+        partial(
+            query_table,
+            TABLE_NAME,
+            {"id": ids[start:start + IDS_BATCH_SIZE]},
+            select="id",
+            use_cache=False,
+        )
+        for start in range(0, len(ids), IDS_BATCH_SIZE)
+    ))
+    return {row["id"] for rows in batches for row in rows}
+
+
+def update_recruiters(recruiters: List[Recruiter]) -> List[Recruiter]:
+    """
+    Save several existing recruiters with one request per BULK_BATCH_SIZE rows
+    
+    Runs the recruiter_bulk_update function (needs its migration): one UPDATE
+    per batch, which never inserts. name is written for every Recruiter, and
+    description when it is not None (as with to_dict, None leaves the stored
+    description unchanged). The IDs are checked before anything is written,
+    so an unknown ID rejects the whole call. Each batch is written all or
+    nothing, including when one of its recruiters was deleted after the
+    check; if a batch fails, the batches before it stay written.
+    
+    Args:
+        recruiters: Recruiter objects with their ID set, each ID at most once
+        
+    Returns:
+        Updated Recruiters, in the same order
+        
+    Raises:
+        InvalidInput: an ID is missing, repeated or does not exist
+    """
+    # Lowercased to compare with the canonical form PostgreSQL returns
+    ids = [str(r.id).lower() for r in recruiters if r.id is not None]
+    if len(ids) != len(recruiters):
+        raise InvalidInput("Every recruiter to update needs an id")
+    if len(set(ids)) != len(ids):
+        raise InvalidInput("Each recruiter can only be updated once per call")
+    unknown = set(ids) - _existing_ids(ids)
+    if unknown:
+        raise InvalidInput(f"Unknown recruiter ids: {', '.join(sorted(unknown))}")
+    
+    updated = []
+    for start in range(0, len(recruiters), BULK_BATCH_SIZE):
+        batch = recruiters[start:start + BULK_BATCH_SIZE]
+        rows = [
+            {"id": str(r.id), "name": r.name, "description": r.description}
+            if r.description is not None else {"id": str(r.id), "name": r.name}
+            for r in batch
+        ]
+        result = call_function("recruiter_bulk_update", {"rows": rows}, TABLE_NAME)
+        by_id = {str(r.id): r for r in Recruiter.from_rows(result)}
+        updated.extend(by_id[str(r.id).lower()] for r in batch)
+    return updated
+
+
 def update_recruiter(recruiter_id: str, updates: Dict[str, Any]) -> Optional[Recruiter]:
     """
     Update a recruiter
@@ -178,6 +375,32 @@ def delete_recruiter(recruiter_id: str) -> bool:
     return bool(result and len(result) > 0)
 
 
+def set_recruiters_active(recruiter_ids: Sequence[str], active: bool) -> List[Recruiter]:
+    """
+    Deactivate or reactivate several recruiters in one request
+    
+    Runs the recruiter_bulk_set_active function (one UPDATE, all or
+    nothing; needs its migration); deactive_at is set from the database
+    clock. deactivate_recruiter/reactivate_recruiter handle a single ID with
+    a plain update instead.
+    
+    Args:
+        recruiter_ids: UUIDs of the recruiters
+        active: True to reactivate, False to deactivate
+        
+    Returns:
+        Updated Recruiters; IDs that do not exist are left out
+    """
+    if not recruiter_ids:
+        return []
+    result = call_function(
+        "recruiter_bulk_set_active",
+        {"ids": [str(recruiter_id) for recruiter_id in recruiter_ids], "active": active},
+        TABLE_NAME,
+    )
+    return Recruiter.from_rows(result)
+
+
 def deactivate_recruiter(recruiter_id: str) -> Optional[Recruiter]:
     """
     Soft delete - mark recruiter as inactive
@@ -188,7 +411,7 @@ def deactivate_recruiter(recruiter_id: str) -> Optional[Recruiter]:
     Returns:
         Updated Recruiter or None if not found
     """
-    updates = {"deactive_at": datetime.utcnow().isoformat()}
+    updates = {"deactive_at": now_iso()}
     return update_recruiter(recruiter_id, updates)
 
 
@@ -0,0 +1,151 @@
+"""
+Serialization module - orjson-backed JSON provider for the Flask app
+"""
+import decimal
+import operator
+import uuid
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
+from flask.json.provider import JSONProvider
+
+# UUIDs, dataclasses and datetimes are encoded natively by orjson; naive
+# datetimes are treated as UTC and UTC is written as "Z", matching now_iso().
+# Keys are written in insertion order: sorting them (Flask's default) made list
+# responses about 40% slower to encode.
+_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson does not handle natively"""
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        # orjson only encodes exact uuid.UUID natively, not subclasses like DbUUID
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def fast_dumps(obj: Any) -> bytes:
+    """
+    Serialize obj to JSON bytes with orjson
+
+    Args:
+        obj: Value to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+class RowEncoders(NamedTuple):
+    """Generated serializers for one model, see make_encoders"""
+    columns: Tuple[str, ...]
+    serialize: Callable[[Any], Dict[str, Any]]
+    serialize_many: Callable[[List[Any]], List[Dict[str, Any]]]
+    serialize_rows: Callable[[List[Any]], List[Tuple[Any, ...]]]
+
+
+def make_encoders(
+    fields: Dict[str, Optional[Callable[[Any], Any]]],
+    attrs: Optional[Dict[str, str]] = None,
+) -> RowEncoders:
+    """
+    Generate specialized model -> JSON-ready serializers for a list endpoint
+
+    The counterpart of utils.make_decoders: the dict literal for a row is
+    generated once, e.g. for {"id": str, "name": None} the per-row expression is:
+
+        {"id": None if (_v := o.id) is None else _f_id(_v), "name": o.name}
+
+    serialize_many and serialize_rows run it inside a single list
+    comprehension, so a list costs no extra Python call per row.
+
+    Args:
+        fields: Mapping of output key to converter, in output order; None
+            means the attribute value is used as is. Converted values stay
+            None when the attribute is None.
+        attrs: Attribute names for keys that differ from the attribute name
+
+    Returns:
+        RowEncoders with the keys as columns, serialize (one object -> dict),
+        serialize_many (objects -> dicts) and serialize_rows (objects -> tuples
+        in column order)
+    """
+    attrs = attrs or {}
+    namespace: Dict[str, Any] = {}
+    values = []
+    for key, converter in fields.items():
+        attr = attrs.get(key, key)
+        if not key.isidentifier() or not attr.isidentifier():
+            raise ValueError(f"Invalid field name: {key!r}")
+        if converter is not None:
+            namespace[f"_f_{key}"] = converter
+            values.append(f"None if (_v := o.{attr}) is None else _f_{key}(_v)")
+        else:
+            values.append(f"o.{attr}")
+
+    as_dict = "{" + ", ".join(f"{key!r}: {value}" for key, value in zip(fields, values)) + "}"
+    as_tuple = "(" + ", ".join(values) + ",)"
+    source = (
+        f"def serialize(o):\n    return {as_dict}\n"
+        f"def serialize_many(items):\n    return [{as_dict} for o in items]\n"
+        f"def serialize_rows(items):\n    return [{as_tuple} for o in items]\n"
+    )
+    exec(source, namespace)
+    return RowEncoders(
+        tuple(fields),
+        namespace["serialize"],
+        namespace["serialize_many"],
+        namespace["serialize_rows"],
+    )
+
+
+def passthrough_encoders(columns: Tuple[str, ...]) -> RowEncoders:
+    """
+    RowEncoders for database rows that already have the response shape
+
+    For rows selected with exactly these columns, in this order, whose values
+    need no conversion: the rows are sent as they are, so orjson encodes them
+    in C without any Python work per row, and the columnar layout picks the
+    values with a single itemgetter.
+
+    Args:
+        columns: Selected columns, in response order
+
+    Returns:
+        RowEncoders for lists of row dictionaries
+    """
+    columns = tuple(columns)
+    if len(columns) == 1:
+        # itemgetter with a single key returns the bare value, not a tuple
+        column = columns[0]
+        values = lambda row: (row[column],)
+    else:
+        values = operator.itemgetter(*columns)
+    return RowEncoders(
+        columns,
+        dict,
+        list,
+        lambda rows: list(map(values, rows)),
+    )
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider using orjson for jsonify() and request.get_json()
+
+    Responses are built from the bytes orjson returns, skipping the
+    intermediate str that the stdlib encoder produces.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return fast_dumps(obj).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(fast_dumps(obj) + b"\n", mimetype="application/json")
@@ -0,0 +1,20 @@
+-- Trigram indexes for the partial-match searches.
+-- search_applicants and search_clients send ILIKE '%term%' filters to
+-- PostgREST; a plain btree index cannot serve a leading wildcard, a
+-- pg_trgm GIN index can.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- search_applicants: name OR last_name, city
+CREATE INDEX IF NOT EXISTS applicants_name_trgm_idx
+    ON applicants USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS applicants_last_name_trgm_idx
+    ON applicants USING gin (last_name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS applicants_city_trgm_idx
+    ON applicants USING gin (city gin_trgm_ops);
+
+-- search_clients: name, description
+CREATE INDEX IF NOT EXISTS client_name_trgm_idx
+    ON client USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS client_description_trgm_idx
+    ON client USING gin (description gin_trgm_ops);
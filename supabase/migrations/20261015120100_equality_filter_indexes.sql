@@ -0,0 +1,25 @@
+-- Btree indexes for the equality filters sent to PostgREST.
+-- Postgres does not index foreign key columns automatically, so lookups of
+-- an applicant's or a job's applications scanned the whole table.
+--
+-- Migrations run inside a transaction, so CONCURRENTLY cannot be used here;
+-- on a large production table create the index by hand with
+-- CREATE INDEX CONCURRENTLY first and this migration becomes a no-op.
+
+-- get_applications_by_applicant, search_applications(applicant_id=...)
+CREATE INDEX IF NOT EXISTS applicant_job_apply_applicant_id_idx
+    ON applicant_job_apply (applicant_id);
+
+-- get_applications_by_job, search_applications(job_description_id=...)
+CREATE INDEX IF NOT EXISTS applicant_job_apply_job_description_id_idx
+    ON applicant_job_apply (job_description_id);
+
+-- search_applications(recruiter_id=...); only active rows are searched by
+-- recruiter and most applications have no recruiter, so the index is partial
+CREATE INDEX IF NOT EXISTS applicant_job_apply_recruiter_id_active_idx
+    ON applicant_job_apply (recruiter_id)
+    WHERE deactive_at IS NULL AND recruiter_id IS NOT NULL;
+
+-- search_applicants(email=...)
+CREATE INDEX IF NOT EXISTS applicants_email_idx
+    ON applicants (email);
@@ -0,0 +1,11 @@
+-- Composite index for search_applications with both applicant_id and
+-- job_description_id (e.g. checking whether an applicant already applied to
+-- a job). Only active rows are searched, so the index is partial; an
+-- additional recruiter_id filter is applied to the matching rows.
+--
+-- Nothing enforces one application per applicant and job, so the search
+-- still returns every matching row rather than assuming a single one.
+
+CREATE INDEX IF NOT EXISTS applicant_job_apply_applicant_job_active_idx
+    ON applicant_job_apply (applicant_id, job_description_id)
+    WHERE deactive_at IS NULL;
@@ -0,0 +1,7 @@
+-- Index for the min_salary range filter of search_job_descriptions
+-- (min_salary=gte.X&min_salary=lte.Y). Only active job descriptions are
+-- searched, so the index is partial.
+
+CREATE INDEX IF NOT EXISTS job_description_min_salary_active_idx
+    ON job_description (min_salary)
+    WHERE deactive_at IS NULL;
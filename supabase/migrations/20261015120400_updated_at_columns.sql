@@ -0,0 +1,30 @@
+-- Last-modified time of job descriptions and job applications. The single
+-- record GET endpoints build their ETag from (id, updated_at), so polling
+-- clients get a 304 without the response being encoded.
+--
+-- updated_at is maintained by a trigger, so every write path (the API,
+-- the dashboard, SQL) bumps it.
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$;
+
+ALTER TABLE job_description
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+DROP TRIGGER IF EXISTS job_description_set_updated_at ON job_description;
+CREATE TRIGGER job_description_set_updated_at
+    BEFORE UPDATE ON job_description
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
+
+ALTER TABLE applicant_job_apply
+    ADD COLUMN IF NOT EXISTS updated_at timestamptz NOT NULL DEFAULT now();
+
+DROP TRIGGER IF EXISTS applicant_job_apply_set_updated_at ON applicant_job_apply;
+CREATE TRIGGER applicant_job_apply_set_updated_at
+    BEFORE UPDATE ON applicant_job_apply
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
@@ -0,0 +1,10 @@
+-- Trigram indexes for search_recruiters, which sends ILIKE '%term%' filters
+-- on name and description to PostgREST (see 20261015120000 for the other
+-- searches).
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS recruiter_name_trgm_idx
+    ON recruiter USING gin (name gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS recruiter_description_trgm_idx
+    ON recruiter USING gin (description gin_trgm_ops);
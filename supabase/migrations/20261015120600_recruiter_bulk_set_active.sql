@@ -0,0 +1,13 @@
+-- Deactivate or reactivate several recruiters in one statement. Called
+-- through PostgREST (POST /rest/v1/rpc/recruiter_bulk_set_active), so a bulk
+-- change is one round-trip and one transaction instead of one PATCH per row.
+-- SECURITY INVOKER (the default) keeps the caller's row level security.
+
+CREATE OR REPLACE FUNCTION recruiter_bulk_set_active(ids uuid[], active boolean)
+    RETURNS SETOF recruiter
+    LANGUAGE sql AS $$
+    UPDATE recruiter
+    SET deactive_at = CASE WHEN active THEN NULL ELSE now() END
+    WHERE id = ANY(ids)
+    RETURNING *;
+$$;
@@ -0,0 +1,37 @@
+-- Update several existing recruiters in one statement. Called through
+-- PostgREST (POST /rest/v1/rpc/recruiter_bulk_update) with a JSON array of
+-- {"id", "name", "description"} objects; a missing "description" key keeps
+-- the stored description.
+--
+-- Unlike an upsert, this never inserts: if any id does not exist (e.g. it was
+-- deleted after the caller checked it), the function raises and the whole
+-- batch is rolled back.
+
+CREATE OR REPLACE FUNCTION recruiter_bulk_update(rows jsonb)
+    RETURNS SETOF recruiter
+    LANGUAGE plpgsql AS $$
+DECLARE
+    updated recruiter[];
+BEGIN
+    WITH changed AS (
+        UPDATE recruiter AS r
+        SET name = item->>'name',
+            description = CASE
+                WHEN item ? 'description' THEN item->>'description'
+                ELSE r.description
+            END
+        FROM jsonb_array_elements(rows) AS item
+        WHERE r.id = (item->>'id')::uuid
+        RETURNING r AS changed_row
+    )
+    SELECT coalesce(array_agg(changed_row), '{}') INTO updated FROM changed;
+
+    IF cardinality(updated) <> jsonb_array_length(rows) THEN
+        RAISE EXCEPTION 'recruiter_bulk_update: % of % recruiters exist',
+            cardinality(updated), jsonb_array_length(rows)
+            USING ERRCODE = 'no_data_found';
+    END IF;
+
+    RETURN QUERY SELECT * FROM unnest(updated);
+END;
+$$;
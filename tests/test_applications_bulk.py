@@ -0,0 +1,140 @@
+"""
+Tests for POST /api/applicant-job-applications/bulk (create_applications)
+
+Supabase is replaced by an httpx.MockTransport installed through
+database._create_http_client, as in test_recruiters_bulk.
+"""
+import json
+import uuid
+
+import httpx
+import pytest
+
+from api import cache, database
+from api.applicant_job_apply import TABLE_NAME, ApplicantJobApply, create_applications
+from api.index import app
+
+URL = "/api/applicant-job-applications/bulk"
+
+
+class FakePostgrest:
+    """Minimal PostgREST for applicant_job_apply, with foreign key checks"""
+
+    def __init__(self):
+        self.rows = []
+        self.requests = []
+        self.applicants = {str(uuid.uuid4()), str(uuid.uuid4())}
+        self.job_descriptions = {str(uuid.uuid4())}
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        assert request.method == "POST"
+        assert request.url.path == f"/rest/v1/{TABLE_NAME}"
+        items = json.loads(request.content)
+        # One INSERT statement: a violation on any row creates none of them
+        if any(
+            item["applicant_id"] not in self.applicants
+            or item["job_description_id"] not in self.job_descriptions
+            for item in items
+        ):
+            return httpx.Response(409, json={
+                "code": "23503",
+                "message": f'insert or update on table "{TABLE_NAME}" violates foreign key constraint',
+                "details": None,
+                "hint": None,
+            })
+        created = []
+        for item in items:
+            created.append({
+                "id": len(self.rows) + len(created) + 1,
+                "recruiter_id": None,
+                "created_at": "2026-10-15T12:00:00+00:00",
+                "updated_at": "2026-10-15T12:00:00+00:00",
+                "deactive_at": None,
+                **item,
+            })
+        self.rows.extend(created)
+        return httpx.Response(201, json=created)
+
+    def item(self, applicant=0):
+        return {
+            "applicant_id": sorted(self.applicants)[applicant],
+            "job_description_id": next(iter(self.job_descriptions)),
+        }
+
+
+@pytest.fixture
+def postgrest(monkeypatch):
+    fake = FakePostgrest()
+    monkeypatch.setattr(database, "SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setattr(database, "SUPABASE_KEY", "header.payload.signature")
+    monkeypatch.setattr(
+        database, "_create_http_client", lambda: httpx.Client(transport=httpx.MockTransport(fake.handle))
+    )
+    database.reset_supabase_client()
+    cache.invalidate(TABLE_NAME)
+    yield fake
+    database.reset_supabase_client()
+    cache.invalidate(TABLE_NAME)
+
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+
+def test_bulk_creates_every_row(postgrest, client):
+    items = [postgrest.item(0), postgrest.item(1)]
+
+    response = client.post(URL, json=items)
+
+    assert response.status_code == 201
+    body = response.get_json()
+    assert body["count"] == 2
+    assert [row["applicant_id"] for row in body["data"]] == [i["applicant_id"] for i in items]
+    assert [row["id"] for row in body["data"]] == [1, 2]
+    # All rows in a single INSERT
+    assert len(postgrest.requests) == 1
+    assert len(postgrest.rows) == 2
+
+
+def test_create_applications_copies_generated_columns(postgrest):
+    applications = [ApplicantJobApply(**{k: uuid.UUID(v) for k, v in postgrest.item(0).items()})]
+
+    (created,) = create_applications(applications)
+
+    assert created is applications[0]
+    assert created.id == 1
+    assert created.created_at_iso == "2026-10-15T12:00:00+00:00"
+    assert created.updated_at_iso == "2026-10-15T12:00:00+00:00"
+
+
+def test_bulk_rejects_invalid_item_naming_its_index(postgrest, client):
+    items = [postgrest.item(0), {**postgrest.item(1), "applicant_id": "not-a-uuid"}]
+
+    response = client.post(URL, json=items)
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Item 1: applicant_id must be a UUID"
+    assert postgrest.requests == []
+
+
+def test_bulk_rejects_item_missing_required_fields(postgrest, client):
+    response = client.post(URL, json=[postgrest.item(0), {"applicant_id": postgrest.item(1)["applicant_id"]}])
+
+    assert response.status_code == 400
+    assert response.get_json()["error"].startswith("Item 1:")
+    assert postgrest.requests == []
+
+
+def test_bulk_failed_insert_creates_nothing(postgrest, client):
+    items = [postgrest.item(0), {**postgrest.item(1), "job_description_id": str(uuid.uuid4())}]
+
+    response = client.post(URL, json=items)
+
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["success"] is False
+    # The constraint name is not sent to the client
+    assert "constraint" not in body["error"]
+    assert postgrest.rows == []
@@ -0,0 +1,185 @@
+"""
+Tests for the batched recruiter writes (create_recruiters, update_recruiters)
+
+Supabase is replaced by an httpx.MockTransport installed through
+database._create_http_client, so the tests check the PostgREST requests
+actually sent.
+"""
+import json
+import uuid
+
+import httpx
+import pytest
+
+from api import cache, database, recruiters
+from api.recruiters import Recruiter, create_recruiters, update_recruiters
+from api.utils import InvalidInput
+
+
+class FakePostgrest:
+    """Minimal PostgREST for the recruiter table, recording every request"""
+
+    def __init__(self):
+        self.rows = {}
+        self.requests = []
+        # Index (1-based) of the write request to answer with an error
+        self.fail_write = None
+
+    def writes(self):
+        return [r for r in self.requests if r.method == "POST"]
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.method == "GET":
+            # Existence check: select=id&id=in.(a,b,...)
+            assert request.url.path == "/rest/v1/recruiter"
+            ids = request.url.params["id"][len("in.("):-1].split(",")
+            return httpx.Response(200, json=[{"id": i} for i in ids if i in self.rows])
+        assert request.method == "POST"
+        if len(self.writes()) == self.fail_write:
+            return httpx.Response(400, json={
+                "code": "23514", "message": "check constraint violated", "details": None, "hint": None,
+            })
+        if request.url.path == "/rest/v1/rpc/recruiter_bulk_update":
+            return self._bulk_update(json.loads(request.content)["rows"])
+        assert request.url.path == "/rest/v1/recruiter"
+        result = []
+        for row in json.loads(request.content):
+            row_id = str(uuid.uuid4())
+            self.rows[row_id] = {
+                "id": row_id, "description": None, "created_at": "2026-10-15T12:00:00+00:00", "deactive_at": None,
+                **row,
+            }
+            result.append(dict(self.rows[row_id]))
+        return httpx.Response(201, json=result)
+
+    def _bulk_update(self, items):
+        """recruiter_bulk_update: update existing rows only, all or nothing"""
+        if any(item["id"] not in self.rows for item in items):
+            return httpx.Response(400, json={
+                "code": "P0002", "message": "recruiter_bulk_update: 1 of 2 recruiters exist", "details": None, "hint": None,
+            })
+        for item in items:
+            self.rows[item["id"]].update(item)
+        return httpx.Response(200, json=[dict(self.rows[item["id"]]) for item in items])
+
+
+@pytest.fixture
+def postgrest(monkeypatch):
+    fake = FakePostgrest()
+    monkeypatch.setattr(database, "SUPABASE_URL", "https://test.supabase.co")
+    monkeypatch.setattr(database, "SUPABASE_KEY", "header.payload.signature")
+    monkeypatch.setattr(
+        database, "_create_http_client", lambda: httpx.Client(transport=httpx.MockTransport(fake.handle))
+    )
+    monkeypatch.setattr(recruiters, "BULK_BATCH_SIZE", 2)
+    database.reset_supabase_client()
+    cache.invalidate(recruiters.TABLE_NAME)
+    yield fake
+    database.reset_supabase_client()
+    cache.invalidate(recruiters.TABLE_NAME)
+
+
+def _existing(postgrest, count):
+    """Store count recruiters and return them as Recruiter objects"""
+    created = []
+    for index in range(count):
+        row_id = str(uuid.uuid4())
+        postgrest.rows[row_id] = {
+            "id": row_id, "name": f"R{index}", "description": f"d{index}",
+            "created_at": "2026-10-15T12:00:00+00:00", "deactive_at": None,
+        }
+        created.append(Recruiter.from_dict(postgrest.rows[row_id]))
+    return created
+
+
+def test_create_recruiters_sends_one_insert_per_batch(postgrest):
+    created = create_recruiters([Recruiter(name=f"N{i}") for i in range(5)])
+
+    assert [len(json.loads(r.content)) for r in postgrest.writes()] == [2, 2, 1]
+    assert [r.name for r in created] == ["N0", "N1", "N2", "N3", "N4"]
+    assert all(r.id is not None for r in created)
+
+
+def test_create_recruiters_failure_in_later_batch_keeps_earlier_batches(postgrest):
+    postgrest.fail_write = 2
+
+    with pytest.raises(Exception, match="Error inserting into recruiter"):
+        create_recruiters([Recruiter(name=f"N{i}") for i in range(5)])
+
+    # Batch 1 was sent and stored, batch 2 failed, batch 3 was never sent
+    assert len(postgrest.writes()) == 2
+    assert sorted(row["name"] for row in postgrest.rows.values()) == ["N0", "N1"]
+
+
+def test_update_recruiters_sends_one_upsert_per_batch_in_order(postgrest):
+    existing = _existing(postgrest, 3)
+    for r in existing:
+        r.name += "-updated"
+
+    updated = update_recruiters(list(reversed(existing)))
+
+    assert [r.method for r in postgrest.requests] == ["GET", "POST", "POST"]
+    assert [len(json.loads(r.content)["rows"]) for r in postgrest.writes()] == [2, 1]
+    assert all(r.url.path == "/rest/v1/rpc/recruiter_bulk_update" for r in postgrest.writes())
+    assert [r.name for r in updated] == ["R2-updated", "R1-updated", "R0-updated"]
+
+
+def test_update_recruiters_keeps_description_when_none(postgrest):
+    existing = _existing(postgrest, 2)
+    existing[0].description = None
+    existing[1].description = "new"
+
+    updated = update_recruiters(existing)
+
+    assert [r.description for r in updated] == ["d0", "new"]
+    # Both rows go in one request, the first without a description key
+    (write,) = postgrest.writes()
+    assert json.loads(write.content)["rows"] == [
+        {"id": str(existing[0].id), "name": "R0"},
+        {"id": str(existing[1].id), "name": "R1", "description": "new"},
+    ]
+
+
+def test_update_recruiters_never_recreates_a_row_deleted_after_the_check(postgrest, monkeypatch):
+    existing = _existing(postgrest, 2)
+    deleted = str(existing[1].id)
+    check = recruiters._existing_ids
+
+    def check_then_delete(ids):
+        found = check(ids)
+        del postgrest.rows[deleted]
+        return found
+
+    monkeypatch.setattr(recruiters, "_existing_ids", check_then_delete)
+
+    with pytest.raises(database.APIError):
+        update_recruiters(existing)
+
+    assert deleted not in postgrest.rows
+    assert postgrest.rows[str(existing[0].id)]["name"] == "R0"
+
+
+def test_update_recruiters_rejects_unknown_ids_before_writing(postgrest):
+    existing = _existing(postgrest, 1)
+    unknown = Recruiter(id=str(uuid.uuid4()), name="ghost")
+
+    with pytest.raises(InvalidInput, match=str(unknown.id)):
+        update_recruiters(existing + [unknown])
+
+    assert postgrest.writes() == []
+    assert str(unknown.id) not in postgrest.rows
+
+
+def test_update_recruiters_failure_in_later_batch_keeps_earlier_batches(postgrest):
+    existing = _existing(postgrest, 4)
+    for r in existing:
+        r.name += "-updated"
+    postgrest.fail_write = 2
+
+    with pytest.raises(database.APIError):
+        update_recruiters(existing)
+
+    assert len(postgrest.writes()) == 2
+    names = [postgrest.rows[str(r.id)]["name"] for r in existing]
+    assert names == ["R0-updated", "R1-updated", "R2", "R3"]
@@ -0,0 +1,15 @@
+"""
+WSGI entry point for running the API under Gunicorn with gevent workers
+
+    pip install -r requirements-server.txt
+    gunicorn -k gevent -w 2 --worker-connections 1000 wsgi:app
+
+Vercel imports api/index.py directly and does not use this module.
+"""
+from gevent import monkey
+
+# Patch sockets, ssl and threading before httpx and supabase are imported, so
+# a worker blocked on a Supabase request switches to other requests instead
+monkey.patch_all()
+
+from api.index import app  # noqa: E402